@@ -69,6 +69,7 @@ class ValidationErrors:
     CANNOT_DEFER_TOO_CLOSE_TO_DUE_DATE = "Cannot defer task too close to the due date."
     CANNOT_DEFER_A_DONE_TASK = "Cannot defer a task that is already marked as done."
     PAGE_POSITIVE = "Page must be a positive integer"
+    INVALID_CURSOR = "Invalid pagination cursor."
     LIMIT_POSITIVE = "Limit must be a positive integer"
     MAX_LIMIT_EXCEEDED = "Maximum limit of {0} exceeded"
     INVALID_SEARCH_QUERY_TYPE = "Search query must be a string."
@@ -6,3 +6,4 @@ from todo.dto.task_dto import TaskDTO
 
 class GetTasksResponse(PaginatedResponse):
     tasks: List[TaskDTO] = []
+    next_cursor: str | None = None
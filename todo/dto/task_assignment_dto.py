@@ -1,28 +1,17 @@
 from pydantic import BaseModel, validator
 from typing import Optional, Literal
 from datetime import datetime
-from bson import ObjectId
+
+from todo.models.common.pyobjectid import PyObjectId
 
 
 class CreateTaskAssignmentDTO(BaseModel):
-    task_id: str
-    assignee_id: str
+    # Ids parse to ObjectId once at DTO ingress, so the service and
+    # repository layers never re-validate the hex strings
+    task_id: PyObjectId
+    assignee_id: PyObjectId
     user_type: Literal["user", "team"]
-    team_id: Optional[str] = None
-
-    @validator("task_id")
-    def validate_task_id(cls, value):
-        """Validate that the task ID is a valid ObjectId."""
-        if not ObjectId.is_valid(value):
-            raise ValueError(f"Invalid task ID: {value}")
-        return value
-
-    @validator("assignee_id")
-    def validate_assignee_id(cls, value):
-        """Validate that the assignee ID is a valid ObjectId."""
-        if not ObjectId.is_valid(value):
-            raise ValueError(f"Invalid assignee ID: {value}")
-        return value
+    team_id: Optional[PyObjectId] = None
 
     @validator("user_type")
     def validate_user_type(cls, value):
@@ -31,13 +20,6 @@ class CreateTaskAssignmentDTO(BaseModel):
             raise ValueError("user_type must be either 'user' or 'team'")
         return value
 
-    @validator("team_id")
-    def validate_team_id(cls, value):
-        """Validate that the original team ID is a valid ObjectId if provided."""
-        if value is not None and not ObjectId.is_valid(value):
-            raise ValueError(f"Invalid original team ID: {value}")
-        return value
-
 
 class TaskAssignmentDTO(BaseModel):
     id: str
@@ -41,3 +41,26 @@ class TaskModel(Document):
     updatedBy: str | None = None
 
     model_config = ConfigDict(ser_enum="value")
+
+    def dual_write_payload(self) -> dict:
+        """Field subset the dual-write service syncs to Postgres."""
+        return self.model_dump(include=_DUAL_WRITE_FIELDS)
+
+
+# Fields mirrored to the Postgres task row; dumped in one pydantic-core pass
+# instead of hand-building the dict at each call site.
+_DUAL_WRITE_FIELDS = {
+    "title",
+    "description",
+    "priority",
+    "status",
+    "displayId",
+    "isAcknowledged",
+    "isDeleted",
+    "startedAt",
+    "dueAt",
+    "createdAt",
+    "updatedAt",
+    "createdBy",
+    "updatedBy",
+}
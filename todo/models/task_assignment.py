@@ -3,6 +3,7 @@ from typing import ClassVar, Literal
 from datetime import datetime, timezone
 from bson import ObjectId
 
+from todo.dto.task_assignment_dto import TaskAssignmentDTO, TaskAssignmentResponseDTO
 from todo.models.common.document import Document
 from todo.models.common.pyobjectid import PyObjectId
 
@@ -18,6 +19,7 @@ class TaskAssignmentModel(Document):
     task_id: PyObjectId
     assignee_id: PyObjectId  # Can be either team_id or user_id
     user_type: Literal["user", "team"]  # Changed from relation_type to user_type as requested
+    assignee_name: str | None = None  # Denormalized display name; refreshed on user/team rename
     is_active: bool = True
     created_by: PyObjectId
     updated_by: PyObjectId | None = None
@@ -39,3 +41,45 @@ class TaskAssignmentModel(Document):
         if v not in ["user", "team"]:
             raise ValueError("user_type must be either 'user' or 'team'")
         return v
+
+    _OBJECT_ID_FIELDS: ClassVar[tuple[str, ...]] = (
+        "id",
+        "task_id",
+        "assignee_id",
+        "executor_id",
+        "team_id",
+        "created_by",
+        "updated_by",
+    )
+
+    def _ids_as_str(self) -> dict:
+        """Stringify every ObjectId field in one pass, keeping None as None."""
+        values = {}
+        for name in self._OBJECT_ID_FIELDS:
+            value = getattr(self, name)
+            values[name] = str(value) if value is not None else None
+        return values
+
+    def to_dto(self, assignee_name: str | None = None) -> TaskAssignmentDTO:
+        """Build the API DTO; each ObjectId field is stringified exactly once."""
+        # model_construct skips re-validating values this model already validated
+        return TaskAssignmentDTO.model_construct(
+            **self._ids_as_str(),
+            assignee_name=assignee_name or self.assignee_name,
+            user_type=self.user_type,
+            is_active=self.is_active,
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+        )
+
+    def to_response_dto(self, assignee_name: str | None = None) -> TaskAssignmentResponseDTO:
+        """Build the response DTO; each ObjectId field is stringified exactly once."""
+        # model_construct skips re-validating values this model already validated
+        return TaskAssignmentResponseDTO.model_construct(
+            **self._ids_as_str(),
+            assignee_name=assignee_name or self.assignee_name,
+            user_type=self.user_type,
+            is_active=self.is_active,
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+        )
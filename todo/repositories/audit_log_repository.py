@@ -1,12 +1,28 @@
+import logging
+import queue
+import threading
+from datetime import datetime, timezone
+
+from pymongo import WriteConcern
+
 from todo.models.audit_log import AuditLogModel
 from todo.repositories.common.mongo_repository import MongoRepository
-from datetime import datetime, timezone
 from todo.services.enhanced_dual_write_service import EnhancedDualWriteService
 
+logger = logging.getLogger(__name__)
+
+_AUDIT_QUEUE_MAXSIZE = 10000
+_AUDIT_BATCH_SIZE = 500
+_AUDIT_FLUSH_INTERVAL_SECONDS = 0.5
+
 
 class AuditLogRepository(MongoRepository):
     collection_name = AuditLogModel.collection_name
 
+    _queue: queue.Queue = queue.Queue(maxsize=_AUDIT_QUEUE_MAXSIZE)
+    _drain_thread: threading.Thread | None = None
+    _drain_lock = threading.Lock()
+
     @classmethod
     def create(cls, audit_log: AuditLogModel) -> AuditLogModel:
         collection = cls.get_collection()
@@ -15,6 +31,79 @@ class AuditLogRepository(MongoRepository):
         insert_result = collection.insert_one(audit_log_dict)
         audit_log.id = insert_result.inserted_id
 
+        cls._sync_to_postgres(audit_log)
+
+        return audit_log
+
+    @classmethod
+    def create_many(cls, audit_logs: list[AuditLogModel]) -> list[AuditLogModel]:
+        """
+        Insert several audit logs in one `insert_many` round-trip.
+        """
+        if not audit_logs:
+            return audit_logs
+        collection = cls.get_collection()
+        now = datetime.now(timezone.utc)
+        for audit_log in audit_logs:
+            audit_log.timestamp = now
+        docs = [audit_log.model_dump(mode="json", by_alias=True, exclude_none=True) for audit_log in audit_logs]
+        insert_result = collection.insert_many(docs, ordered=False)
+        for audit_log, inserted_id in zip(audit_logs, insert_result.inserted_ids):
+            audit_log.id = inserted_id
+            cls._sync_to_postgres(audit_log)
+        return audit_logs
+
+    @classmethod
+    def enqueue(cls, audit_log: AuditLogModel) -> None:
+        """
+        Queue an audit log for background insertion.
+
+        Audit writes are best-effort and never need to block the request path;
+        a daemon thread drains the queue in batches with a single unacknowledged
+        `insert_many` per batch. If the queue is full the entry is dropped with
+        a warning rather than stalling the caller.
+        """
+        audit_log.timestamp = datetime.now(timezone.utc)
+        cls._ensure_drain_thread()
+        try:
+            cls._queue.put_nowait(audit_log)
+        except queue.Full:
+            logger.warning(f"Audit log queue full; dropping entry for task {audit_log.task_id}")
+
+    @classmethod
+    def _ensure_drain_thread(cls) -> None:
+        if cls._drain_thread is not None and cls._drain_thread.is_alive():
+            return
+        with cls._drain_lock:
+            if cls._drain_thread is None or not cls._drain_thread.is_alive():
+                cls._drain_thread = threading.Thread(target=cls._drain_loop, name="audit-log-writer", daemon=True)
+                cls._drain_thread.start()
+
+    @classmethod
+    def _drain_loop(cls) -> None:
+        while True:
+            batch = [cls._queue.get()]
+            while len(batch) < _AUDIT_BATCH_SIZE:
+                try:
+                    batch.append(cls._queue.get(timeout=_AUDIT_FLUSH_INTERVAL_SECONDS))
+                except queue.Empty:
+                    break
+            cls._flush(batch)
+
+    @classmethod
+    def _flush(cls, batch: list[AuditLogModel]) -> None:
+        try:
+            collection = cls.get_collection().with_options(write_concern=WriteConcern(w=0))
+            docs = [log.model_dump(mode="json", by_alias=True, exclude_none=True) for log in batch]
+            insert_result = collection.insert_many(docs, ordered=False)
+            for audit_log, inserted_id in zip(batch, insert_result.inserted_ids):
+                audit_log.id = inserted_id
+                cls._sync_to_postgres(audit_log)
+        except Exception:
+            logger.exception(f"Failed to flush {len(batch)} audit log(s)")
+
+    @classmethod
+    def _sync_to_postgres(cls, audit_log: AuditLogModel) -> None:
         dual_write_service = EnhancedDualWriteService()
         audit_log_data = {
             "task_id": str(audit_log.task_id) if audit_log.task_id else None,
@@ -36,13 +125,8 @@ class AuditLogRepository(MongoRepository):
         )
 
         if not dual_write_success:
-            import logging
-
-            logger = logging.getLogger(__name__)
             logger.warning(f"Failed to sync audit log {audit_log.id} to Postgres")
 
-        return audit_log
-
     @classmethod
     def get_by_team_id(cls, team_id: str) -> list[AuditLogModel]:
         collection = cls.get_collection()
@@ -1,6 +1,9 @@
 from datetime import datetime, timezone
 from typing import Optional, List
 from bson import ObjectId
+from django.core.cache import cache
+from pymongo.collection import ReturnDocument
+from pymongo.errors import DuplicateKeyError
 
 from todo.exceptions.task_exceptions import TaskNotFoundException
 from todo.models.task_assignment import TaskAssignmentModel
@@ -49,18 +52,35 @@ class TaskAssignmentRepository(MongoRepository):
 
         return task_assignment
 
+    GET_BY_TASK_ID_CACHE_TTL = 30
+
     @classmethod
     def get_by_task_id(cls, task_id: str) -> Optional[TaskAssignmentModel]:
         """
-        Get the task assignment for a specific task.
+        Get the active task assignment for a task, serving repeat lookups from
+        a short-TTL cache.
+
+        replace_active_assignment primes this key after writing, so a read
+        following a write in the same process never re-fetches (read-your-writes).
         """
+        cache_key = f"task_assignment:{task_id}"
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+        assignment = cls._fetch_by_task_id(task_id)
+        if assignment is not None:
+            cache.set(cache_key, assignment, cls.GET_BY_TASK_ID_CACHE_TTL)
+        return assignment
+
+    @classmethod
+    def _fetch_by_task_id(cls, task_id: str) -> Optional[TaskAssignmentModel]:
         collection = cls.get_collection()
         try:
             # Try with ObjectId first
             task_assignment_data = collection.find_one({"task_id": ObjectId(task_id), "is_active": True})
             if not task_assignment_data:
                 # Try with string if ObjectId doesn't work
-                task_assignment_data = collection.find_one({"task_id": task_id, "is_active": True})
+                task_assignment_data = collection.find_one({"task_id": str(task_id), "is_active": True})
 
             if task_assignment_data:
                 return TaskAssignmentModel(**task_assignment_data)
@@ -68,6 +88,27 @@ class TaskAssignmentRepository(MongoRepository):
         except Exception:
             return None
 
+    @classmethod
+    def get_by_task_ids(cls, task_ids: List[str]) -> List[TaskAssignmentModel]:
+        """
+        Get the active assignments for many tasks in a single query.
+        """
+        if not task_ids:
+            return []
+        collection = cls.get_collection()
+        try:
+            # task_id is stored as either ObjectId or string; match both forms
+            id_variants: List = []
+            for task_id in task_ids:
+                if ObjectId.is_valid(task_id):
+                    id_variants.append(ObjectId(task_id))
+                id_variants.append(task_id)
+
+            cursor = collection.find({"task_id": {"$in": id_variants}, "is_active": True}).batch_size(1000)
+            return [TaskAssignmentModel(**data) for data in cursor]
+        except Exception:
+            return []
+
     @classmethod
     def get_by_assignee_id(cls, assignee_id: str, user_type: str) -> List[TaskAssignmentModel]:
         """
@@ -88,6 +129,151 @@ class TaskAssignmentRepository(MongoRepository):
         except Exception:
             return []
 
+    @classmethod
+    def replace_active_assignment(
+        cls,
+        task_id: str | ObjectId,
+        assignee_id: str | ObjectId,
+        user_type: str,
+        team_id: Optional[str | ObjectId],
+        user_id: str,
+        assignee_name: Optional[str] = None,
+    ) -> tuple[TaskAssignmentModel, Optional[TaskAssignmentModel]]:
+        """
+        Atomically create or replace the active assignment for a task.
+
+        A single upserting find_one_and_update rewrites the active document in
+        place (or inserts one when none exists), and its pre-image doubles as
+        the existing-assignment read. Together with the unique partial index on
+        active task_id, concurrent assigns collapse to one active row instead
+        of racing a read-modify-write.
+        Returns (new_assignment, previous_assignment_or_None).
+        """
+        collection = cls.get_collection()
+        now = datetime.now(timezone.utc)
+        task_oid = ObjectId(task_id)
+        assignee_oid = ObjectId(assignee_id)
+        user_oid = ObjectId(user_id)
+        upsert_id = ObjectId()
+
+        if user_type == "team":
+            team_id_expr = str(assignee_id)
+        elif team_id:
+            team_id_expr = str(team_id)
+        else:
+            # A user assigned without a team inherits the previous assignment's team
+            team_id_expr = {"$ifNull": ["$team_id", None]}
+
+        # On upsert the pipeline starts from an empty document, so a missing
+        # user_type distinguishes insert from replace
+        is_replace = {"$ne": [{"$type": "$user_type"}, "missing"]}
+        for attempt in range(2):
+            try:
+                previous_data = collection.find_one_and_update(
+                    # task_id is stored as either ObjectId or string; match both forms
+                    {"task_id": {"$in": [task_oid, str(task_id)]}, "is_active": True},
+                    # Ids are written in string form, matching create()'s
+                    # model_dump(mode="json") documents and the string-typed
+                    # comparisons in the team/POC aggregation lookups
+                    [
+                        {
+                            "$set": {
+                                "_id": {"$ifNull": ["$_id", upsert_id]},
+                                "task_id": str(task_id),
+                                "assignee_id": str(assignee_id),
+                                "user_type": user_type,
+                                "assignee_name": assignee_name,
+                                "is_active": True,
+                                "team_id": team_id_expr,
+                                "executor_id": None,
+                                "created_by": {"$ifNull": ["$created_by", str(user_id)]},
+                                "created_at": {"$ifNull": ["$created_at", now]},
+                                "updated_by": {"$cond": [is_replace, str(user_id), None]},
+                                "updated_at": {"$cond": [is_replace, now, None]},
+                            }
+                        }
+                    ],
+                    upsert=True,
+                    return_document=ReturnDocument.BEFORE,
+                )
+                break
+            except DuplicateKeyError:
+                # A concurrent assign won the upsert; retry once to replace its row
+                if attempt:
+                    raise
+        previous = TaskAssignmentModel(**previous_data) if previous_data else None
+
+        if user_type == "team":
+            resolved_team_id = assignee_oid
+        elif team_id:
+            resolved_team_id = ObjectId(team_id)
+        else:
+            resolved_team_id = previous.team_id if previous else None
+
+        assignment = TaskAssignmentModel(
+            _id=previous.id if previous else upsert_id,
+            task_id=task_oid,
+            assignee_id=assignee_oid,
+            user_type=user_type,
+            assignee_name=assignee_name,
+            is_active=True,
+            team_id=resolved_team_id,
+            created_by=previous.created_by if previous else user_oid,
+            created_at=previous.created_at if previous else now,
+            updated_by=user_oid if previous else None,
+            updated_at=now if previous else None,
+        )
+
+        dual_write_service = EnhancedDualWriteService()
+        assignment_data = {
+            "task_mongo_id": str(assignment.task_id),
+            "assignee_id": str(assignment.assignee_id),
+            "user_type": assignment.user_type,
+            "team_id": str(assignment.team_id) if assignment.team_id else None,
+            "is_active": True,
+            "created_at": assignment.created_at,
+            "updated_at": assignment.updated_at,
+            "created_by": str(assignment.created_by),
+            "updated_by": str(assignment.updated_by) if assignment.updated_by else None,
+        }
+
+        if previous:
+            dual_write_success = dual_write_service.update_document(
+                collection_name="task_assignments", data=assignment_data, mongo_id=str(assignment.id)
+            )
+        else:
+            dual_write_success = dual_write_service.create_document(
+                collection_name="task_assignments", data=assignment_data, mongo_id=str(assignment.id)
+            )
+
+        if not dual_write_success:
+            import logging
+
+            logger = logging.getLogger(__name__)
+            logger.warning(f"Failed to sync task assignment {assignment.id} to Postgres")
+
+        # Prime the by-task cache so a same-process read-after-write skips Mongo
+        cache.set(f"task_assignment:{task_id}", assignment, cls.GET_BY_TASK_ID_CACHE_TTL)
+
+        return assignment, previous
+
+    @classmethod
+    def refresh_assignee_name(cls, assignee_id: str, name: str) -> None:
+        """
+        Propagate a user/team rename to the denormalized assignee_name.
+        """
+        collection = cls.get_collection()
+        try:
+            collection.update_many(
+                {"assignee_id": {"$in": [ObjectId(assignee_id), str(assignee_id)]}, "is_active": True},
+                {"$set": {"assignee_name": name}},
+            )
+        except Exception:
+            import logging
+
+            logger = logging.getLogger(__name__)
+            logger.warning(f"Failed to refresh assignee_name for assignee {assignee_id}")
+
     @classmethod
     def update_assignment(
         cls, task_id: str, assignee_id: str, user_type: str, user_id: str
@@ -167,7 +353,12 @@ class TaskAssignmentRepository(MongoRepository):
                 team_id=PyObjectId(team_id),
             )
 
-            return cls.create(new_assignment)
+            created = cls.create(new_assignment)
+            # Prime the by-task cache with the post-write assignment so a
+            # same-process read-after-write sees the new document, not the
+            # entry the pre-write lookup may have cached
+            cache.set(f"task_assignment:{task_id}", created, cls.GET_BY_TASK_ID_CACHE_TTL)
+            return created
         except Exception:
             return None
 
@@ -205,6 +396,9 @@ class TaskAssignmentRepository(MongoRepository):
                 )
 
             if result.modified_count > 0:
+                # Evict after the write so cached reads stop returning the
+                # now-inactive assignment
+                cache.delete(f"task_assignment:{task_id}")
                 # Sync to PostgreSQL
                 dual_write_service = EnhancedDualWriteService()
                 assignment_data = {
@@ -248,6 +442,7 @@ class TaskAssignmentRepository(MongoRepository):
                     "$set": {
                         "assignee_id": executor_id,
                         "user_type": "user",
+                        "assignee_name": None,
                         "updated_by": user_id,
                         "updated_at": datetime.now(timezone.utc),
                     }
@@ -261,6 +456,7 @@ class TaskAssignmentRepository(MongoRepository):
                         "$set": {
                             "assignee_id": executor_id,
                             "user_type": "user",
+                            "assignee_name": None,
                             "updated_by": user_id,
                             "updated_at": datetime.now(timezone.utc),
                         }
@@ -268,6 +464,8 @@ class TaskAssignmentRepository(MongoRepository):
                 )
 
             if result.modified_count > 0:
+                # Evict after the write so cached reads pick up the new executor
+                cache.delete(f"task_assignment:{task_id}")
                 # Sync to PostgreSQL
                 dual_write_service = EnhancedDualWriteService()
                 assignment_data = {
@@ -330,6 +528,9 @@ class TaskAssignmentRepository(MongoRepository):
                 )
 
             if result.modified_count > 0:
+                # Evict after the write so cached reads stop returning the
+                # now-inactive assignment
+                cache.delete(f"task_assignment:{task_id}")
                 # Sync to PostgreSQL for each assignment
                 dual_write_service = EnhancedDualWriteService()
                 assignment_data = {
@@ -411,8 +612,11 @@ class TaskAssignmentRepository(MongoRepository):
                             tasks_to_clear_deferred_ids.append(tasks["_id"])
 
                     collection.update_many(
+                        # is_active narrows the filter to the rows selected above and
+                        # lets the partial (task_id, is_active) index serve the update
                         {
                             "task_id": {"$in": not_done_tasks_ids},
+                            "is_active": True,
                         },
                         {
                             "$set": {
@@ -424,16 +628,20 @@ class TaskAssignmentRepository(MongoRepository):
                         },
                         session=session,
                     )
+                    for reassigned_task_id in not_done_tasks_ids:
+                        cache.delete(f"task_assignment:{reassigned_task_id}")
 
-                    for assignment in user_task_assignments:
-                        AuditLogRepository.create(
+                    AuditLogRepository.create_many(
+                        [
                             AuditLogModel(
                                 task_id=PyObjectId(assignment["task_id"]),
                                 team_id=PyObjectId(team_id),
                                 action="assigned_to_team",
                                 performed_by=PyObjectId(performed_by_user_id),
                             )
-                        )
+                            for assignment in user_task_assignments
+                        ]
+                    )
 
                     tasks_collection.update_many(
                         {"_id": {"$in": tasks_to_reset_status_ids}},
@@ -1,6 +1,9 @@
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import List
 from bson import ObjectId
+from django.core.cache import cache
+from pydantic import TypeAdapter
 from pymongo import ReturnDocument
 
 from todo.exceptions.task_exceptions import TaskNotFoundException
@@ -15,52 +18,119 @@ from todo.constants.task import (
     SORT_ORDER_DESC,
     TaskStatus,
 )
-from todo.repositories.team_repository import UserTeamDetailsRepository
+from todo.models.task_assignment import TaskAssignmentModel
+from todo.models.team import TeamModel, UserTeamDetailsModel
 from todo.services.enhanced_dual_write_service import EnhancedDualWriteService
 from todo.models.postgres import PostgresTask, PostgresDeferredDetails
 
 
+# Static sub-filters shared by the status-filter builders so each call only
+# allocates the leaves that embed the current timestamp.
+_DEFERRED_SET = {"deferredDetails": {"$ne": None}}
+_DEFERRED_UNSET = {"deferredDetails": None}
+_STATUS_NOT_DONE = {"status": {"$ne": TaskStatus.DONE.value}}
+
+
+def _deferred_status_filter(now: datetime) -> dict:
+    return {"$and": [_DEFERRED_SET, {"deferredDetails.deferredTill": {"$gt": now}}]}
+
+
+def _not_deferred_filter(now: datetime) -> dict:
+    return {"$or": [_DEFERRED_UNSET, {"deferredDetails.deferredTill": {"$lt": now}}]}
+
+
+def _done_status_filter(now: datetime) -> dict:
+    # Matching status explicitly (rather than just "not deferred") keeps the
+    # result set to actual DONE tasks and lets the (status, deferredTill)
+    # compound index satisfy the predicate.
+    return {"$and": [{"status": TaskStatus.DONE.value}, _not_deferred_filter(now)]}
+
+
+def _default_status_filter(now: datetime) -> dict:
+    return {"$and": [_STATUS_NOT_DONE, _not_deferred_filter(now)]}
+
+
+_STATUS_FILTER_BUILDERS = {
+    TaskStatus.DEFERRED.value: _deferred_status_filter,
+    TaskStatus.DONE.value: _done_status_filter,
+}
+
+
+# Precompiled batch validator: one Rust-core pass over a page of documents is
+# noticeably cheaper than constructing TaskModel per document in Python.
+_TASK_LIST_ADAPTER = TypeAdapter(List[TaskModel])
+
+
+@lru_cache(maxsize=4096)
+def _to_oid(value: str) -> ObjectId | None:
+    """Cached str -> ObjectId conversion; returns None for invalid ids.
+
+    Ids repeat heavily within and across requests (the authenticated user,
+    team ids), so caching skips the per-call is_valid + construction cost.
+    """
+    return ObjectId(value) if ObjectId.is_valid(value) else None
+
+
 class TaskRepository(MongoRepository):
     collection_name = TaskModel.collection_name
 
-    @classmethod
-    def _get_team_task_ids(cls, team_id: str) -> List[ObjectId]:
-        team_tasks = TaskAssignmentRepository.get_collection().find({"team_id": team_id, "is_active": True})
-        team_task_ids = [ObjectId(task["task_id"]) for task in team_tasks]
-        return list(set(team_task_ids))
+    # Every field prepare_task_dto serializes into a TaskDTO; trimming the
+    # rest cuts bytes on the wire and BSON decode time for every page.
+    LIST_PROJECTION = {
+        "title": 1,
+        "description": 1,
+        "priority": 1,
+        "status": 1,
+        "displayId": 1,
+        "dueAt": 1,
+        "startedAt": 1,
+        "createdAt": 1,
+        "updatedAt": 1,
+        "createdBy": 1,
+        "updatedBy": 1,
+        "deferredDetails": 1,
+        "isAcknowledged": 1,
+        "isDeleted": 1,
+        "labels": 1,
+    }
 
     @classmethod
-    def _build_status_filter(cls, status_filter: str = None) -> dict:
-        now = datetime.now(timezone.utc)
+    def _team_assignment_lookup_stages(cls, team_id: str) -> List[dict]:
+        """Pipeline stages that keep only tasks actively assigned to the given team.
 
-        if status_filter == TaskStatus.DEFERRED.value:
-            return {
-                "$and": [
-                    {"deferredDetails": {"$ne": None}},
-                    {"deferredDetails.deferredTill": {"$gt": now}},
-                ]
-            }
-
-        elif status_filter == TaskStatus.DONE.value:
-            return {
-                "$or": [
-                    {"deferredDetails": None},
-                    {"deferredDetails.deferredTill": {"$lt": now}},
-                ]
-            }
+        Used instead of pre-fetching assignment task ids into Python and passing
+        them back as an `$in` list, which costs an extra round-trip and can blow
+        past the BSON document limit for large teams.
+        """
+        return [
+            {
+                "$lookup": {
+                    "from": TaskAssignmentModel.collection_name,
+                    "let": {"tid": "$_id"},
+                    "pipeline": [
+                        {
+                            "$match": {
+                                "$expr": {
+                                    "$and": [
+                                        {"$eq": ["$task_id", {"$toString": "$$tid"}]},
+                                        {"$eq": ["$is_active", True]},
+                                        {"$eq": ["$team_id", team_id]},
+                                    ]
+                                }
+                            }
+                        },
+                        {"$project": {"_id": 1}},
+                    ],
+                    "as": "_assignments",
+                }
+            },
+            {"$match": {"_assignments.0": {"$exists": True}}},
+        ]
 
-        else:
-            return {
-                "$and": [
-                    {"status": {"$ne": TaskStatus.DONE.value}},
-                    {
-                        "$or": [
-                            {"deferredDetails": None},
-                            {"deferredDetails.deferredTill": {"$lt": now}},
-                        ]
-                    },
-                ]
-            }
+    @classmethod
+    def _build_status_filter(cls, status_filter: str = None) -> dict:
+        builder = _STATUS_FILTER_BUILDERS.get(status_filter, _default_status_filter)
+        return builder(datetime.now(timezone.utc))
 
     @classmethod
     def list(
@@ -72,81 +142,245 @@ class TaskRepository(MongoRepository):
         user_id: str = None,
         team_id: str = None,
         status_filter: str = None,
+        cursor: dict = None,
     ) -> List[TaskModel]:
         tasks_collection = cls.get_collection()
 
         base_filter = cls._build_status_filter(status_filter)
 
+        lookup_stages = []
         if team_id:
-            all_team_task_ids = cls._get_team_task_ids(team_id)
-            query_filter = {"$and": [base_filter, {"_id": {"$in": all_team_task_ids}}]}
+            # Assignment filtering happens inside the aggregation itself; see
+            # _team_assignment_lookup_stages.
+            query_filter = base_filter
+            lookup_stages = cls._team_assignment_lookup_stages(team_id)
         elif user_id:
             assigned_task_ids = cls._get_assigned_task_ids_for_user(user_id)
-            query_filter = {"$and": [base_filter, {"_id": {"$in": assigned_task_ids}}]}
+            query_filter = {"$and": [base_filter, {"_id": {"$in": list(assigned_task_ids)}}]}
         else:
             query_filter = base_filter
 
-        if sort_by == SORT_FIELD_UPDATED_AT:
-            sort_direction = -1 if order == SORT_ORDER_DESC else 1
+        sort_criteria = cls._resolve_sort_criteria(sort_by, order)
+
+        skip = (page - 1) * limit
+        fetch_limit = limit
+        if cursor and sort_criteria[0][0] == "lastActivity":
+            # Keyset pagination: O(limit) regardless of depth, unlike skip()
+            # which walks and discards every preceding document.
+            sort_direction = sort_criteria[0][1]
+            range_op = "$lt" if sort_direction == -1 else "$gt"
+            keyset_filter = {
+                "$or": [
+                    {"lastActivity": {range_op: cursor["lastActivity"]}},
+                    {"lastActivity": cursor["lastActivity"], "_id": {range_op: ObjectId(cursor["_id"])}},
+                ]
+            }
+            query_filter = {"$and": [query_filter, keyset_filter]}
+            sort_criteria = [*sort_criteria, ("_id", sort_direction)]
+            skip = 0
+            # One look-ahead row past the page tells the service whether a
+            # next page exists, without a separate count query
+            fetch_limit = limit + 1
+
+        if lookup_stages:
             pipeline = [
                 {"$match": query_filter},
-                {"$addFields": {"lastActivity": {"$ifNull": [{"$toDate": "$updatedAt"}, {"$toDate": "$createdAt"}]}}},
-                {"$sort": {"lastActivity": sort_direction}},
-                {"$skip": (page - 1) * limit},
-                {"$limit": limit},
-                {"$project": {"lastActivity": 0}},
+                *lookup_stages,
+                {"$sort": dict(sort_criteria)},
+                {"$skip": skip},
+                {"$limit": fetch_limit},
+                {"$project": cls.LIST_PROJECTION},
             ]
             tasks_cursor = tasks_collection.aggregate(pipeline)
-            return [TaskModel(**task) for task in tasks_cursor]
+            return _TASK_LIST_ADAPTER.validate_python(list(tasks_cursor))
+
+        tasks_cursor = (
+            tasks_collection.find(query_filter, cls.LIST_PROJECTION).sort(sort_criteria).skip(skip).limit(fetch_limit)
+        )
+        return _TASK_LIST_ADAPTER.validate_python(list(tasks_cursor))
 
+    @classmethod
+    def _resolve_sort_criteria(cls, sort_by: str, order: str) -> List[tuple]:
         if sort_by == SORT_FIELD_PRIORITY:
             sort_direction = 1 if order == SORT_ORDER_DESC else -1
-            sort_criteria = [(sort_by, sort_direction)]
-        elif sort_by == SORT_FIELD_ASSIGNEE:
+            return [(sort_by, sort_direction)]
+        sort_direction = -1 if order == SORT_ORDER_DESC else 1
+        if sort_by == SORT_FIELD_UPDATED_AT:
+            # lastActivity is maintained on every write (updatedAt falling back
+            # to createdAt) so this sort can use a plain index instead of a
+            # per-document $ifNull/$toDate aggregation.
+            return [("lastActivity", sort_direction)]
+        if sort_by == SORT_FIELD_ASSIGNEE:
             # Assignee sorting is no longer supported since assignee is in separate collection
-            sort_direction = -1 if order == SORT_ORDER_DESC else 1
-            sort_criteria = [("createdAt", sort_direction)]
+            return [("createdAt", sort_direction)]
+        return [(sort_by, sort_direction)]
+
+    @classmethod
+    def list_with_count(
+        cls,
+        page: int,
+        limit: int,
+        sort_by: str,
+        order: str,
+        user_id: str = None,
+        team_id: str = None,
+        status_filter: str = None,
+    ) -> tuple[List[TaskModel], int]:
+        """Fetch one page of tasks and the matching total in a single round-trip.
+
+        Runs the same match/lookup stages as list() but finishes with a $facet
+        so the server streams the documents once, instead of a separate list()
+        and count() query pair re-resolving the same assignment lookups.
+        """
+        tasks_collection = cls.get_collection()
+
+        base_filter = cls._build_status_filter(status_filter)
+
+        lookup_stages = []
+        if team_id:
+            query_filter = base_filter
+            lookup_stages = cls._team_assignment_lookup_stages(team_id)
+        elif user_id:
+            assigned_task_ids = cls._get_assigned_task_ids_for_user(user_id)
+            query_filter = {"$and": [base_filter, {"_id": {"$in": list(assigned_task_ids)}}]}
         else:
-            sort_direction = -1 if order == SORT_ORDER_DESC else 1
-            sort_criteria = [(sort_by, sort_direction)]
+            query_filter = base_filter
 
-        tasks_cursor = tasks_collection.find(query_filter).sort(sort_criteria).skip((page - 1) * limit).limit(limit)
-        return [TaskModel(**task) for task in tasks_cursor]
+        pipeline = [{"$match": query_filter}, *lookup_stages]
+        sort_stage = dict(cls._resolve_sort_criteria(sort_by, order))
 
-    @classmethod
-    def _get_assigned_task_ids_for_user(cls, user_id: str) -> List[ObjectId]:
-        """Get task IDs where user is assigned (either directly or as team member)."""
-        direct_assignments = TaskAssignmentRepository.get_by_assignee_id(user_id, "user")
-        direct_task_ids = [assignment.task_id for assignment in direct_assignments]
-
-        # Get teams where user is a member
-        from todo.repositories.team_repository import TeamRepository
-
-        user_teams = UserTeamDetailsRepository.get_by_user_id(user_id)
-        team_ids = [str(team.team_id) for team in user_teams]
-
-        # Get tasks assigned to those teams (only if user is POC)
-        team_task_ids = []
-        if team_ids:
-            # Get teams where user is POC
-            poc_teams = TeamRepository.get_collection().find(
-                {
-                    "_id": {"$in": [ObjectId(team_id) for team_id in team_ids]},
-                    "is_deleted": False,
-                    "poc_id": {"$in": [ObjectId(user_id), user_id]},
+        pipeline.append(
+            {
+                "$facet": {
+                    "items": [
+                        {"$sort": sort_stage},
+                        {"$skip": (page - 1) * limit},
+                        {"$limit": limit},
+                        {"$project": cls.LIST_PROJECTION},
+                    ],
+                    "total": [{"$count": "count"}],
                 }
-            )
+            }
+        )
+
+        result = next(iter(tasks_collection.aggregate(pipeline)), None)
+        if not result:
+            return [], 0
+
+        tasks = _TASK_LIST_ADAPTER.validate_python(result["items"])
+        total = result["total"][0]["count"] if result["total"] else 0
+        return tasks, total
+
+    ASSIGNED_TASK_IDS_CACHE_TTL = 30
+
+    @classmethod
+    def _get_assigned_task_ids_for_user(cls, user_id: str) -> set[ObjectId]:
+        """Get task IDs where user is assigned (either directly or as team member).
+
+        Returned as a set so authorization checks get O(1) membership.
+
+        The result is cached for a short TTL because list(), count() and
+        delete_by_id() can each resolve the same user within one request;
+        assignments changing mid-window simply show up on the next page load.
+        """
+        return cache.get_or_set(
+            f"user:{user_id}:assigned_task_ids",
+            lambda: cls._fetch_assigned_task_ids_for_user(user_id),
+            cls.ASSIGNED_TASK_IDS_CACHE_TTL,
+        )
 
-            poc_team_ids = [str(team["_id"]) for team in poc_teams]
+    @classmethod
+    def _fetch_assigned_task_ids_for_user(cls, user_id: str) -> set[ObjectId]:
+        """Resolve assigned task ids from Mongo without consulting the cache.
 
-            # Get team assignments for POC teams
-            if poc_team_ids:
-                team_assignments = TaskAssignmentRepository.get_collection().find(
-                    {"assignee_id": {"$in": poc_team_ids}, "user_type": "team", "is_active": True}
-                )
-                team_task_ids = [ObjectId(assignment["task_id"]) for assignment in team_assignments]
+        Runs as a single aggregation on the task assignments collection: direct
+        assignments are matched first, then a `$unionWith` sub-pipeline walks
+        user_team_details -> teams (only teams where the user is POC) -> team
+        assignments, so the whole resolution costs one database round-trip.
+        """
+        user_oid = _to_oid(user_id)
+        user_id_variants = [user_oid, user_id] if user_oid else [user_id]
+        pipeline = [
+            {
+                "$match": {
+                    "assignee_id": {"$in": user_id_variants},
+                    "user_type": "user",
+                    "is_active": True,
+                }
+            },
+            {
+                "$unionWith": {
+                    "coll": UserTeamDetailsModel.collection_name,
+                    "pipeline": [
+                        {"$match": {"user_id": user_id, "is_active": True}},
+                        {
+                            "$lookup": {
+                                "from": TeamModel.collection_name,
+                                "let": {"tid": "$team_id"},
+                                "pipeline": [
+                                    {
+                                        "$match": {
+                                            "$expr": {
+                                                "$and": [
+                                                    {
+                                                        "$eq": [
+                                                            "$_id",
+                                                            {
+                                                                "$convert": {
+                                                                    "input": "$$tid",
+                                                                    "to": "objectId",
+                                                                    "onError": None,
+                                                                }
+                                                            },
+                                                        ]
+                                                    },
+                                                    {"$eq": ["$is_deleted", False]},
+                                                    # poc_id is normalized to ObjectId by migration
+                                                    {"$eq": ["$poc_id", user_oid]},
+                                                ]
+                                            }
+                                        }
+                                    },
+                                    {"$project": {"_id": 1}},
+                                ],
+                                "as": "poc_teams",
+                            }
+                        },
+                        {"$unwind": "$poc_teams"},
+                        {
+                            "$lookup": {
+                                "from": TaskAssignmentModel.collection_name,
+                                "let": {"tid": {"$toString": "$poc_teams._id"}},
+                                "pipeline": [
+                                    {
+                                        "$match": {
+                                            "$expr": {
+                                                "$and": [
+                                                    {"$eq": ["$assignee_id", "$$tid"]},
+                                                    {"$eq": ["$user_type", "team"]},
+                                                    {"$eq": ["$is_active", True]},
+                                                ]
+                                            }
+                                        }
+                                    },
+                                    {"$project": {"task_id": 1}},
+                                ],
+                                "as": "team_assignments",
+                            }
+                        },
+                        {"$unwind": "$team_assignments"},
+                        {"$replaceRoot": {"newRoot": "$team_assignments"}},
+                    ],
+                }
+            },
+            # Dedup and cast server-side so Python doesn't re-run ObjectId()
+            # over a set comprehension for every returned assignment.
+            {"$group": {"_id": {"$toObjectId": "$task_id"}}},
+        ]
 
-        return direct_task_ids + team_task_ids
+        # Larger batches cut getMore round-trips for users assigned to many tasks.
+        assignments = TaskAssignmentRepository.get_collection().aggregate(pipeline, batchSize=1000)
+        return {assignment["_id"] for assignment in assignments}
 
     @classmethod
     def count(cls, user_id: str = None, team_id: str = None, status_filter: str = None) -> int:
@@ -155,13 +389,18 @@ class TaskRepository(MongoRepository):
         base_filter = cls._build_status_filter(status_filter)
 
         if team_id:
-            all_team_task_ids = cls._get_team_task_ids(team_id)
-            query_filter = {"$and": [base_filter, {"_id": {"$in": all_team_task_ids}}]}
+            pipeline = [
+                {"$match": base_filter},
+                *cls._team_assignment_lookup_stages(team_id),
+                {"$count": "count"},
+            ]
+            result = list(tasks_collection.aggregate(pipeline))
+            return result[0]["count"] if result else 0
 
         elif user_id:
             assigned_task_ids = cls._get_assigned_task_ids_for_user(user_id)
             query_filter = {
-                "$and": [base_filter, {"$or": [{"createdBy": user_id}, {"_id": {"$in": assigned_task_ids}}]}]
+                "$and": [base_filter, {"$or": [{"createdBy": user_id}, {"_id": {"$in": list(assigned_task_ids)}}]}]
             }
         else:
             query_filter = base_filter
@@ -178,7 +417,7 @@ class TaskRepository(MongoRepository):
         tasks_collection = cls.get_collection()
         tasks_cursor = tasks_collection.find()
 
-        return [TaskModel(**task) for task in tasks_cursor]
+        return _TASK_LIST_ADAPTER.validate_python(list(tasks_cursor))
 
     @classmethod
     def create(cls, task: TaskModel) -> TaskModel:
@@ -200,14 +439,13 @@ class TaskRepository(MongoRepository):
                     # Atomically increment and get the next counter value
                     db = cls.get_database()
                     counter_result = db.counters.find_one_and_update(
-                        {"_id": "taskDisplayId"}, {"$inc": {"seq": 1}}, return_document=True, session=session
+                        {"_id": "taskDisplayId"},
+                        {"$inc": {"seq": 1}},
+                        upsert=True,
+                        return_document=ReturnDocument.AFTER,
+                        session=session,
                     )
-
-                    if not counter_result:
-                        db.counters.insert_one({"_id": "taskDisplayId", "seq": 1}, session=session)
-                        next_number = 1
-                    else:
-                        next_number = counter_result["seq"]
+                    next_number = counter_result["seq"]
 
                     task.displayId = f"#{next_number}"
                     task.createdAt = datetime.now(timezone.utc)
@@ -218,87 +456,105 @@ class TaskRepository(MongoRepository):
                         task.createdAt = datetime.now(timezone.utc)
 
                     task_dict = task.model_dump(mode="json", by_alias=True, exclude_none=True)
+                    task_dict["lastActivity"] = task.createdAt
                     insert_result = tasks_collection.insert_one(task_dict, session=session)
 
                     task.id = insert_result.inserted_id
 
                     dual_write_service = EnhancedDualWriteService()
 
-                    task_data = {
-                        "title": task.title,
-                        "description": task.description,
-                        "priority": task.priority,
-                        "status": task.status,
-                        "displayId": task.displayId,
-                        "isAcknowledged": task.isAcknowledged,
-                        "isDeleted": task.isDeleted,
-                        "startedAt": task.startedAt,
-                        "dueAt": task.dueAt,
-                        "createdAt": task.createdAt or datetime.now(timezone.utc),
-                        "updatedAt": task.updatedAt,
-                        "createdBy": str(task.createdBy),
-                        "updatedBy": str(task.updatedBy) if task.updatedBy else None,
-                    }
-
-                    dual_write_success = dual_write_service.create_document(
+                    task_data = task.dual_write_payload()
+
+                    # Postgres is secondary; sync it off the request thread so
+                    # its latency stays out of the create path.
+                    dual_write_service.create_document_async(
                         collection_name="tasks", data=task_data, mongo_id=str(task.id)
                     )
 
-                    if not dual_write_success:
-                        import logging
-
-                        logger = logging.getLogger(__name__)
-                        logger.warning(f"Failed to sync task {task.id} to Postgres")
-
                     return task
 
             except Exception as e:
                 raise ValueError(RepositoryErrors.TASK_CREATION_FAILED.format(str(e)))
 
+    GET_BY_ID_CACHE_TTL = 60
+
     @classmethod
     def get_by_id(cls, task_id: str) -> TaskModel | None:
+        """Get a task by id, serving repeat lookups from a short-TTL cache.
+
+        Task writes go through update()/delete_by_id(), which evict the
+        entry, so warm reads stay consistent with this process's writes.
+        """
+        return cache.get_or_set(f"task:{task_id}", lambda: cls._fetch_by_id(task_id), cls.GET_BY_ID_CACHE_TTL)
+
+    @classmethod
+    def _fetch_by_id(cls, task_id: str) -> TaskModel | None:
         tasks_collection = cls.get_collection()
         task_data = tasks_collection.find_one({"_id": ObjectId(task_id)})
         if task_data:
             return TaskModel(**task_data)
         return None
 
+    EXISTS_CACHE_TTL = 5
+
     @classmethod
-    def delete_by_id(cls, task_id: ObjectId, user_id: str) -> TaskModel | None:
-        tasks_collection = cls.get_collection()
+    def exists(cls, task_id: str) -> bool:
+        """Check task existence with an _id-only query and a short positive cache.
 
-        task = tasks_collection.find_one({"_id": task_id, "isDeleted": False})
-        if not task:
-            raise TaskNotFoundException(task_id)
+        Validation paths that never touch the task document (e.g. assignment
+        creation) use this instead of get_by_id, skipping full-document decode.
+        Only positive results are cached so a just-created task is never missed.
+        """
+        cache_key = f"task:{task_id}:exists"
+        if cache.get(cache_key):
+            return True
+        found = cls.get_collection().find_one({"_id": ObjectId(task_id)}, {"_id": 1}) is not None
+        if found:
+            cache.set(cache_key, True, cls.EXISTS_CACHE_TTL)
+        return found
 
-        # Check if user is the creator
-        if user_id != task.get("createdBy"):
-            # Check if user is assigned to this task
-            assigned_task_ids = cls._get_assigned_task_ids_for_user(user_id)
-            if task_id not in assigned_task_ids:
-                raise PermissionError(ApiErrors.UNAUTHORIZED_TITLE)
+    @classmethod
+    def delete_by_id(cls, task_id: ObjectId, user_id: str) -> TaskModel | None:
+        tasks_collection = cls.get_collection()
 
-        # Deactivate assignee relationship for this task
-        TaskAssignmentRepository.deactivate_by_task_id(str(task_id), user_id)
+        assigned_task_ids = cls._get_assigned_task_ids_for_user(user_id)
 
+        # Existence, permission and delete collapse into one atomic update:
+        # the filter only matches when the user created the task or is
+        # assigned to it. The error path pays an extra fetch purely to pick
+        # the right exception.
+        now = datetime.now(timezone.utc)
         deleted_task_data = tasks_collection.find_one_and_update(
-            {"_id": task_id},
+            {
+                "_id": task_id,
+                "isDeleted": False,
+                "$or": [{"createdBy": user_id}, {"_id": {"$in": list(assigned_task_ids)}}],
+            },
             {
                 "$set": {
                     "isDeleted": True,
-                    "updatedAt": datetime.now(timezone.utc),
+                    "updatedAt": now,
+                    "lastActivity": now,
                     "updatedBy": user_id,
                 }
             },
             return_document=ReturnDocument.AFTER,
         )
 
-        if deleted_task_data:
-            return TaskModel(**deleted_task_data)
-        return None
+        if deleted_task_data is None:
+            if tasks_collection.find_one({"_id": task_id, "isDeleted": False}):
+                raise PermissionError(ApiErrors.UNAUTHORIZED_TITLE)
+            raise TaskNotFoundException(task_id)
+
+        cache.delete(f"task:{task_id}")
+
+        # Deactivate assignee relationship for this task
+        TaskAssignmentRepository.deactivate_by_task_id(str(task_id), user_id)
+
+        return TaskModel(**deleted_task_data)
 
     @classmethod
-    def update(cls, task_id: str, update_data: dict) -> TaskModel | None:
+    def update(cls, task_id: str, update_data: dict, authz_filter: dict = None) -> TaskModel | None:
         if not isinstance(update_data, dict):
             raise ValueError("update_data must be a dictionary.")
 
@@ -307,46 +563,34 @@ class TaskRepository(MongoRepository):
         except Exception:
             return None
 
-        update_data_with_timestamp = {**update_data, "updatedAt": datetime.now(timezone.utc)}
+        now = datetime.now(timezone.utc)
+        update_data_with_timestamp = {**update_data, "updatedAt": now, "lastActivity": now}
         update_data_with_timestamp.pop("_id", None)
         update_data_with_timestamp.pop("id", None)
 
         tasks_collection = cls.get_collection()
 
+        query_filter = {"_id": obj_id}
+        if authz_filter:
+            # The guard rides on the write itself, so a permission change
+            # between the caller's pre-check and the update cannot slip through
+            query_filter = {"$and": [query_filter, authz_filter]}
+
         updated_task_doc = tasks_collection.find_one_and_update(
-            {"_id": obj_id}, {"$set": update_data_with_timestamp}, return_document=ReturnDocument.AFTER
+            query_filter, {"$set": update_data_with_timestamp}, return_document=ReturnDocument.AFTER
         )
 
         if updated_task_doc:
+            cache.delete(f"task:{task_id}")
             task_model = TaskModel(**updated_task_doc)
 
             dual_write_service = EnhancedDualWriteService()
-            task_data = {
-                "title": task_model.title,
-                "description": task_model.description,
-                "priority": task_model.priority,
-                "status": task_model.status,
-                "displayId": task_model.displayId,
-                "isAcknowledged": task_model.isAcknowledged,
-                "isDeleted": task_model.isDeleted,
-                "startedAt": task_model.startedAt,
-                "dueAt": task_model.dueAt,
-                "createdAt": task_model.createdAt,
-                "updatedAt": task_model.updatedAt,
-                "createdBy": str(task_model.createdBy),
-                "updatedBy": str(task_model.updatedBy) if task_model.updatedBy else None,
-            }
+            task_data = task_model.dual_write_payload()
 
-            dual_write_success = dual_write_service.update_document(
+            dual_write_service.update_document_async(
                 collection_name="tasks", data=task_data, mongo_id=str(task_model.id)
             )
 
-            if not dual_write_success:
-                import logging
-
-                logger = logging.getLogger(__name__)
-                logger.warning(f"Failed to sync task update {task_model.id} to Postgres")
-
             # Handle deferred details if present in update_data
             if "deferredDetails" in update_data:
                 cls._handle_deferred_details_sync(task_id, update_data["deferredDetails"])
@@ -361,9 +605,9 @@ class TaskRepository(MongoRepository):
 
         base_filter = cls._build_status_filter(status_filter)
 
-        query = {"$and": [base_filter, {"_id": {"$in": assigned_task_ids}}]}
+        query = {"$and": [base_filter, {"_id": {"$in": list(assigned_task_ids)}}]}
         tasks_cursor = tasks_collection.find(query).skip((page - 1) * limit).limit(limit)
-        return [TaskModel(**task) for task in tasks_cursor]
+        return _TASK_LIST_ADAPTER.validate_python(list(tasks_cursor))
 
     @classmethod
     def get_by_ids(cls, task_ids: List[str]) -> List[TaskModel]:
@@ -375,8 +619,8 @@ class TaskRepository(MongoRepository):
             return []
         tasks_collection = cls.get_collection()
         object_ids = [ObjectId(task_id) for task_id in task_ids]
-        cursor = tasks_collection.find({"_id": {"$in": object_ids}})
-        return [TaskModel(**doc) for doc in cursor]
+        cursor = tasks_collection.find({"_id": {"$in": object_ids}}).batch_size(1000)
+        return _TASK_LIST_ADAPTER.validate_python(list(cursor))
 
     @classmethod
     def _handle_deferred_details_sync(cls, task_id: str, deferred_details: dict) -> None:
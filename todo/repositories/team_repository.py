@@ -1,6 +1,7 @@
 from datetime import datetime, timezone
-from typing import Optional
+from typing import List, Optional
 from bson import ObjectId
+from django.core.cache import cache
 from pymongo import ReturnDocument
 
 from todo.models.team import TeamModel, UserTeamDetailsModel
@@ -49,11 +50,17 @@ class TeamRepository(MongoRepository):
 
         return team
 
+    GET_BY_ID_CACHE_TTL = 60
+
     @classmethod
     def get_by_id(cls, team_id: str) -> Optional[TeamModel]:
         """
-        Get a team by its ID.
+        Get a team by its ID, serving repeat lookups from a short-TTL cache.
         """
+        return cache.get_or_set(f"team:{team_id}", lambda: cls._fetch_by_id(team_id), cls.GET_BY_ID_CACHE_TTL)
+
+    @classmethod
+    def _fetch_by_id(cls, team_id: str) -> Optional[TeamModel]:
         teams_collection = cls.get_collection()
         try:
             team_data = teams_collection.find_one({"_id": ObjectId(team_id), "is_deleted": False})
@@ -63,6 +70,65 @@ class TeamRepository(MongoRepository):
         except Exception:
             return None
 
+    EXISTS_CACHE_TTL = 5
+
+    @classmethod
+    def exists(cls, team_id: str) -> bool:
+        """
+        Check team existence with an _id-only query and a short positive cache.
+        Only positive results are cached so a just-created team is never missed.
+        """
+        cache_key = f"team:{team_id}:exists"
+        if cache.get(cache_key):
+            return True
+        try:
+            found = (
+                cls.get_collection().find_one({"_id": ObjectId(team_id), "is_deleted": False}, {"_id": 1}) is not None
+            )
+        except Exception:
+            return False
+        if found:
+            cache.set(cache_key, True, cls.EXISTS_CACHE_TTL)
+        return found
+
+    @classmethod
+    def get_name_by_id(cls, team_id: str) -> Optional[str]:
+        """
+        Get only a team's name, projecting away the rest of the document.
+        """
+        teams_collection = cls.get_collection()
+        try:
+            team_data = teams_collection.find_one(
+                {"_id": ObjectId(team_id), "is_deleted": False}, {"name": 1, "_id": 0}
+            )
+            return team_data["name"] if team_data else None
+        except Exception:
+            return None
+
+    @classmethod
+    def get_by_ids(cls, team_ids: List[str]) -> List[TeamModel]:
+        """
+        Get multiple teams by their IDs in a single database query.
+        Returns only the teams that exist and are not deleted.
+        """
+        if not team_ids:
+            return []
+        teams_collection = cls.get_collection()
+        try:
+            object_ids = [ObjectId(team_id) for team_id in team_ids]
+            cursor = teams_collection.find({"_id": {"$in": object_ids}, "is_deleted": False})
+            return [TeamModel(**doc) for doc in cursor]
+        except Exception:
+            return []
+
+    @classmethod
+    def list_by_ids(cls, team_ids: List[str]) -> dict[str, TeamModel]:
+        """
+        Get multiple teams keyed by string id, for in-memory joins.
+        Missing teams are simply absent from the map.
+        """
+        return {str(team.id): team for team in cls.get_by_ids(team_ids)}
+
     @classmethod
     def get_by_invite_code(cls, invite_code: str) -> Optional[TeamModel]:
         """
@@ -99,6 +165,12 @@ class TeamRepository(MongoRepository):
             )
 
             if updated_doc:
+                cache.delete(f"team:{team_id}")
+                if "name" in update_data:
+                    # Keep the denormalized assignee_name on active assignments current
+                    from todo.repositories.task_assignment_repository import TaskAssignmentRepository
+
+                    TaskAssignmentRepository.refresh_assignee_name(team_id, update_data["name"])
                 return TeamModel(**updated_doc)
             return None
         except Exception:
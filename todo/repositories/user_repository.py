@@ -1,5 +1,6 @@
 from datetime import datetime, timezone
 from typing import Optional, List
+from django.core.cache import cache
 from pymongo.collection import ReturnDocument
 from pymongo import ASCENDING
 
@@ -16,8 +17,20 @@ class UserRepository:
     def _get_collection(cls):
         return DatabaseManager().get_collection("users")
 
+    GET_BY_ID_CACHE_TTL = 60
+
     @classmethod
     def get_by_id(cls, user_id: str) -> Optional[UserModel]:
+        """
+        Get a user by id, serving repeat lookups from a short-TTL cache.
+
+        User records change rarely, so validation and name-resolution paths
+        can reuse a recent result instead of re-querying Mongo.
+        """
+        return cache.get_or_set(f"user:{user_id}", lambda: cls._fetch_by_id(user_id), cls.GET_BY_ID_CACHE_TTL)
+
+    @classmethod
+    def _fetch_by_id(cls, user_id: str) -> Optional[UserModel]:
         try:
             collection = cls._get_collection()
             object_id = PyObjectId(user_id)
@@ -26,6 +39,37 @@ class UserRepository:
         except Exception as e:
             raise UserNotFoundException() from e
 
+    EXISTS_CACHE_TTL = 5
+
+    @classmethod
+    def exists(cls, user_id: str) -> bool:
+        """
+        Check user existence with an _id-only query and a short positive cache.
+        Only positive results are cached so a just-created user is never missed.
+        """
+        cache_key = f"user:{user_id}:exists"
+        if cache.get(cache_key):
+            return True
+        try:
+            found = cls._get_collection().find_one({"_id": PyObjectId(user_id)}, {"_id": 1}) is not None
+        except Exception:
+            return False
+        if found:
+            cache.set(cache_key, True, cls.EXISTS_CACHE_TTL)
+        return found
+
+    @classmethod
+    def get_name_by_id(cls, user_id: str) -> Optional[str]:
+        """
+        Get only a user's name, projecting away the rest of the document.
+        """
+        try:
+            collection = cls._get_collection()
+            doc = collection.find_one({"_id": PyObjectId(user_id)}, {"name": 1, "_id": 0})
+            return doc["name"] if doc else None
+        except Exception:
+            return None
+
     @classmethod
     def get_by_ids(cls, user_ids: List[str]) -> List[UserModel]:
         """
@@ -43,6 +87,14 @@ class UserRepository:
         except Exception as e:
             raise UserNotFoundException() from e
 
+    @classmethod
+    def list_by_ids(cls, user_ids: List[str]) -> dict[str, UserModel]:
+        """
+        Get multiple users keyed by string id, for in-memory joins.
+        Missing users are simply absent from the map.
+        """
+        return {str(user.id): user for user in cls.get_by_ids(user_ids)}
+
     @classmethod
     def create_or_update(cls, user_data: dict) -> UserModel:
         try:
@@ -69,6 +121,12 @@ class UserRepository:
                 raise APIException(RepositoryErrors.USER_OPERATION_FAILED)
 
             user_model = UserModel(**result)
+            cache.delete(f"user:{user_model.id}")
+
+            # Keep the denormalized assignee_name on active assignments current
+            from todo.repositories.task_assignment_repository import TaskAssignmentRepository
+
+            TaskAssignmentRepository.refresh_assignee_name(str(user_model.id), user_model.name)
 
             dual_write_service = EnhancedDualWriteService()
             user_data_for_postgres = {
@@ -34,6 +34,15 @@ class WatchlistRepository(MongoRepository):
             return WatchlistModel(**doc)
         return None
 
+    @classmethod
+    def get_by_user_and_task_ids(cls, user_id: str, task_ids: List[str]) -> dict[str, bool]:
+        """Map task id -> isActive for the user's watchlist entries, in one query."""
+        cursor = cls.get_collection().find(
+            {"userId": user_id, "taskId": {"$in": task_ids}},
+            {"taskId": 1, "isActive": 1, "_id": 0},
+        )
+        return {doc["taskId"]: doc["isActive"] for doc in cursor}
+
     @classmethod
     def create(cls, watchlist_model: WatchlistModel) -> WatchlistModel:
         doc = watchlist_model.model_dump(by_alias=True)
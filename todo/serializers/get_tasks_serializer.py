@@ -32,6 +32,8 @@ class GetTaskQueryParamsSerializer(serializers.Serializer):
 
     profile = serializers.BooleanField(required=False, error_messages={"invalid": "profile must be a boolean value."})
 
+    cursor = serializers.CharField(required=False, allow_blank=False, allow_null=True)
+
     sort_by = serializers.ChoiceField(
         choices=SORT_FIELDS,
         required=False,
@@ -1,4 +1,5 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, Optional
 from django.conf import settings
 
@@ -6,6 +7,10 @@ from todo.services.dual_write_service import DualWriteService
 
 logger = logging.getLogger(__name__)
 
+# Shared worker pool for background Postgres syncs. Mongo is the source of
+# truth, so the secondary write can happen off the request thread.
+_sync_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="dual-write")
+
 
 class EnhancedDualWriteService(DualWriteService):
     """
@@ -37,6 +42,31 @@ class EnhancedDualWriteService(DualWriteService):
 
         return super().update_document(collection_name, mongo_id, data)
 
+    def create_document_async(self, collection_name: str, data: Dict[str, Any], mongo_id: str) -> None:
+        """
+        Queue a Postgres create off the request thread (fire-and-forget).
+        Failures are logged by the worker instead of surfacing to the caller.
+        """
+        _sync_executor.submit(self._run_background_sync, "create", collection_name, data, mongo_id)
+
+    def update_document_async(self, collection_name: str, mongo_id: str, data: Dict[str, Any]) -> None:
+        """
+        Queue a Postgres update off the request thread (fire-and-forget).
+        """
+        _sync_executor.submit(self._run_background_sync, "update", collection_name, data, mongo_id)
+
+    def _run_background_sync(self, operation: str, collection_name: str, data: Dict[str, Any], mongo_id: str) -> None:
+        try:
+            if operation == "create":
+                success = self.create_document(collection_name, data, mongo_id)
+            else:
+                success = self.update_document(collection_name, mongo_id, data)
+
+            if not success:
+                logger.warning(f"Failed to sync {collection_name} document {mongo_id} to Postgres")
+        except Exception as e:
+            logger.warning(f"Background Postgres sync failed for {collection_name}:{mongo_id}: {str(e)}")
+
     def delete_document(self, collection_name: str, mongo_id: str) -> bool:
         """
         Delete a document from both MongoDB and Postgres.
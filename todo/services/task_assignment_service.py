@@ -1,19 +1,30 @@
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
 
 from todo.dto.task_assignment_dto import TaskAssignmentResponseDTO, CreateTaskAssignmentDTO
 from todo.dto.responses.create_task_assignment_response import CreateTaskAssignmentResponse
 from todo.models.common.pyobjectid import PyObjectId
-from todo.models.task_assignment import TaskAssignmentModel
 from todo.repositories.task_assignment_repository import TaskAssignmentRepository
 from todo.repositories.task_repository import TaskRepository
 from todo.repositories.user_repository import UserRepository
 from todo.repositories.team_repository import TeamRepository
 from todo.exceptions.user_exceptions import UserNotFoundException
 from todo.exceptions.task_exceptions import TaskNotFoundException
-from todo.dto.task_assignment_dto import TaskAssignmentDTO
 from todo.models.audit_log import AuditLogModel
 from todo.repositories.audit_log_repository import AuditLogRepository
 
+# Validation reads are independent, so they run concurrently; pymongo
+# releases the GIL during I/O, making the wait max(reads) not sum(reads).
+_validation_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="assignment-validation")
+
+# Per-assignee-type (repository, missing-assignee error factory, name fallback);
+# adding a new assignee type means adding one entry here instead of touching
+# every user/team branch.
+_USER_TYPE_HANDLERS = {
+    "user": (UserRepository, UserNotFoundException, "Unknown User"),
+    "team": (TeamRepository, lambda assignee_id: ValueError(f"Team not found: {assignee_id}"), "Unknown Team"),
+}
+
 
 class TaskAssignmentService:
     @classmethod
@@ -21,74 +32,73 @@ class TaskAssignmentService:
         """
         Create a new task assignment with validation for task, user, and team existence.
         """
-        # Validate task exists
-        task = TaskRepository.get_by_id(dto.task_id)
-        if not task:
-            raise TaskNotFoundException(dto.task_id)
+        performed_by = PyObjectId(user_id)
 
-        # Validate assignee exists based on user_type
-        if dto.user_type == "user":
-            assignee = UserRepository.get_by_id(dto.assignee_id)
-            if not assignee:
-                raise UserNotFoundException(dto.assignee_id)
-        elif dto.user_type == "team":
-            assignee = TeamRepository.get_by_id(dto.assignee_id)
-            if not assignee:
-                raise ValueError(f"Team not found: {dto.assignee_id}")
-        else:
+        # Validate task and assignee existence concurrently
+        try:
+            assignee_repository, missing_assignee_error, _ = _USER_TYPE_HANDLERS[dto.user_type]
+        except KeyError:
             raise ValueError("Invalid user_type")
 
-        # Check if task already has an active assignment
-        existing_assignment = TaskAssignmentRepository.get_by_task_id(dto.task_id)
-        if existing_assignment:
+        # The task check is existence-only (_id projection, briefly cached);
+        # the assignee lookup doubles as its existence check and feeds the
+        # denormalized assignee_name stored on the assignment
+        task_future = _validation_executor.submit(TaskRepository.exists, dto.task_id)
+        assignee_name_future = _validation_executor.submit(assignee_repository.get_name_by_id, str(dto.assignee_id))
+        existing_future = _validation_executor.submit(TaskAssignmentRepository.get_by_task_id, dto.task_id)
+
+        if not task_future.result():
+            raise TaskNotFoundException(dto.task_id)
+
+        assignee_name = assignee_name_future.result()
+        if assignee_name is None:
+            raise missing_assignee_error(dto.assignee_id)
+
+        # Idempotent retries skip the write, the Postgres sync, and the audit
+        # rows entirely when the active assignment already matches the request
+        existing_assignment = existing_future.result()
+        if (
+            existing_assignment
+            and existing_assignment.assignee_id == dto.assignee_id
+            and existing_assignment.user_type == dto.user_type
+        ):
+            return CreateTaskAssignmentResponse(data=existing_assignment.to_dto())
+
+        # Replace any existing active assignment in one round-trip; the
+        # returned pre-image stands in for the old existing-assignment fetch.
+        assignment, previous_assignment = TaskAssignmentRepository.replace_active_assignment(
+            dto.task_id, dto.assignee_id, dto.user_type, dto.team_id, user_id, assignee_name=assignee_name
+        )
+
+        if previous_assignment:
             # If previous assignment was to a team, log unassignment
-            if existing_assignment.user_type == "team":
-                AuditLogRepository.create(
-                    AuditLogModel(
-                        task_id=existing_assignment.task_id,
-                        team_id=existing_assignment.assignee_id,
+            if previous_assignment.user_type == "team":
+                AuditLogRepository.enqueue(
+                    AuditLogModel.model_construct(
+                        task_id=previous_assignment.task_id,
+                        team_id=previous_assignment.assignee_id,
                         action="unassigned_from_team",
-                        performed_by=PyObjectId(user_id),
+                        performed_by=performed_by,
                     )
                 )
-            # Update existing assignment
-            updated_assignment = TaskAssignmentRepository.update_assignment(
-                dto.task_id, dto.assignee_id, dto.user_type, user_id
-            )
-            if not updated_assignment:
-                raise ValueError("Failed to update task assignment")
-            assignment = updated_assignment
-
-        else:
-            # Create new assignment
-            task_assignment = TaskAssignmentModel(
-                task_id=PyObjectId(dto.task_id),
-                assignee_id=PyObjectId(dto.assignee_id),
-                user_type=dto.user_type,
-                created_by=PyObjectId(user_id),
-                updated_by=None,
-                team_id=PyObjectId(dto.team_id) if dto.team_id else None,
-            )
-            assignment = TaskAssignmentRepository.create(task_assignment)
-
-            if assignment.user_type == "user" and assignment.team_id:
-                AuditLogRepository.create(
-                    AuditLogModel(
-                        task_id=assignment.task_id,
-                        team_id=assignment.team_id,
-                        action="assigned_to_member",
-                        performed_by=PyObjectId(user_id),
-                    )
+        elif assignment.user_type == "user" and assignment.team_id:
+            AuditLogRepository.enqueue(
+                AuditLogModel.model_construct(
+                    task_id=assignment.task_id,
+                    team_id=assignment.team_id,
+                    action="assigned_to_member",
+                    performed_by=performed_by,
                 )
+            )
 
         # If new assignment is to a team, log assignment
         if assignment.user_type == "team":
-            AuditLogRepository.create(
-                AuditLogModel(
+            AuditLogRepository.enqueue(
+                AuditLogModel.model_construct(
                     task_id=assignment.task_id,
                     team_id=assignment.assignee_id,
                     action="assigned_to_team",
-                    performed_by=PyObjectId(user_id),
+                    performed_by=performed_by,
                 )
             )
 
@@ -105,21 +115,7 @@ class TaskAssignmentService:
         #         )
         #     )
 
-        # Prepare response
-        response_dto = TaskAssignmentDTO(
-            id=str(assignment.id),
-            task_id=str(assignment.task_id),
-            assignee_id=str(assignment.assignee_id),
-            user_type=assignment.user_type,
-            executor_id=str(assignment.executor_id) if assignment.executor_id else None,
-            is_active=assignment.is_active,
-            created_by=str(assignment.created_by),
-            updated_by=str(assignment.updated_by) if assignment.updated_by else None,
-            created_at=assignment.created_at,
-            updated_at=assignment.updated_at,
-        )
-
-        return CreateTaskAssignmentResponse(data=response_dto)
+        return CreateTaskAssignmentResponse(data=assignment.to_dto())
 
     @classmethod
     def get_task_assignment(cls, task_id: str) -> Optional[TaskAssignmentResponseDTO]:
@@ -130,29 +126,57 @@ class TaskAssignmentService:
         if not assignment:
             return None
 
-        # Get assignee name
-        if assignment.user_type == "user":
-            assignee = UserRepository.get_by_id(str(assignment.assignee_id))
-            assignee_name = assignee.name if assignee else "Unknown User"
-        elif assignment.user_type == "team":
-            assignee = TeamRepository.get_by_id(str(assignment.assignee_id))
-            assignee_name = assignee.name if assignee else "Unknown Team"
-        else:
-            assignee_name = "Unknown"
-
-        return TaskAssignmentResponseDTO(
-            id=str(assignment.id),
-            task_id=str(assignment.task_id),
-            assignee_id=str(assignment.assignee_id),
-            user_type=assignment.user_type,
-            assignee_name=assignee_name,
-            executor_id=str(assignment.executor_id) if assignment.executor_id else None,
-            is_active=assignment.is_active,
-            created_by=str(assignment.created_by),
-            updated_by=str(assignment.updated_by) if assignment.updated_by else None,
-            created_at=assignment.created_at,
-            updated_at=assignment.updated_at,
-        )
+        # The denormalized name on the document avoids a second query;
+        # legacy documents without it fall back to a name-only projection
+        assignee_name = assignment.assignee_name
+        if not assignee_name:
+            handler = _USER_TYPE_HANDLERS.get(assignment.user_type)
+            if handler:
+                assignee_repository, _, name_fallback = handler
+                assignee_name = assignee_repository.get_name_by_id(str(assignment.assignee_id)) or name_fallback
+            else:
+                assignee_name = "Unknown"
+
+        return assignment.to_response_dto(assignee_name)
+
+    @classmethod
+    def get_task_assignments_bulk(cls, task_ids: List[str]) -> dict[str, TaskAssignmentResponseDTO]:
+        """
+        Resolve assignments (with assignee names) for many tasks at once.
+
+        One assignment query plus at most one user fetch and one team fetch
+        replace the 2N round-trips of calling get_task_assignment per task.
+        Returns a dict keyed by task id; tasks without an active assignment
+        are absent.
+        """
+        assignments = TaskAssignmentRepository.get_by_task_ids(task_ids)
+        if not assignments:
+            return {}
+
+        # Denormalized names cover most documents; fetch only the gaps
+        user_ids = {str(a.assignee_id) for a in assignments if a.user_type == "user" and not a.assignee_name}
+        team_ids = {str(a.assignee_id) for a in assignments if a.user_type == "team" and not a.assignee_name}
+
+        users_by_id = {str(user.id): user for user in UserRepository.get_by_ids(list(user_ids))} if user_ids else {}
+        teams_by_id = {str(team.id): team for team in TeamRepository.get_by_ids(list(team_ids))} if team_ids else {}
+
+        assignments_by_task_id = {}
+        for assignment in assignments:
+            assignee_id = str(assignment.assignee_id)
+            if assignment.assignee_name:
+                assignee_name = assignment.assignee_name
+            elif assignment.user_type == "user":
+                assignee = users_by_id.get(assignee_id)
+                assignee_name = assignee.name if assignee else "Unknown User"
+            elif assignment.user_type == "team":
+                assignee = teams_by_id.get(assignee_id)
+                assignee_name = assignee.name if assignee else "Unknown Team"
+            else:
+                assignee_name = "Unknown"
+
+            assignments_by_task_id[str(assignment.task_id)] = assignment.to_response_dto(assignee_name)
+
+        return assignments_by_task_id
 
     @classmethod
     def delete_task_assignment(cls, task_id: str, user_id: str) -> bool:
@@ -1,4 +1,8 @@
-from typing import List
+import base64
+import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, List
 from dataclasses import dataclass
 from django.core.exceptions import ValidationError
 from django.urls import reverse_lazy
@@ -21,6 +25,8 @@ from todo.dto.responses.paginated_response import LinksData
 from todo.exceptions.user_exceptions import UserNotFoundException
 from todo.models.task import TaskModel, DeferredDetailsModel
 from todo.models.task_assignment import TaskAssignmentModel
+from todo.models.team import TeamModel
+from todo.models.user import UserModel
 from todo.repositories.task_assignment_repository import TaskAssignmentRepository
 from todo.dto.task_assignment_dto import TaskAssignmentDTO
 from todo.models.common.pyobjectid import PyObjectId
@@ -28,16 +34,20 @@ from todo.repositories.task_repository import TaskRepository
 from todo.repositories.label_repository import LabelRepository
 from todo.repositories.team_repository import TeamRepository
 from todo.constants.task import (
+    SORT_FIELD_UPDATED_AT,
     TaskStatus,
     TaskPriority,
 )
 from todo.constants.messages import ApiErrors, ValidationErrors
 from django.conf import settings
+from django.core.cache import cache
 from todo.exceptions.task_exceptions import (
     TaskNotFoundException,
     UnprocessableEntityException,
     TaskStateConflictException,
 )
+from bson import ObjectId
+from pymongo.errors import PyMongoError
 from bson.errors import InvalidId as BsonInvalidId
 
 from todo.repositories.user_repository import UserRepository
@@ -47,6 +57,14 @@ from todo.models.audit_log import AuditLogModel
 from todo.repositories.audit_log_repository import AuditLogRepository
 from todo.services.task_assignment_service import TaskAssignmentService
 
+# The page prefetches are independent reads, so they run concurrently;
+# pymongo releases the GIL during I/O, making the wait max(queries)
+# rather than sum(queries).
+_prefetch_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="task-page-prefetch")
+
+# Enum .value lookups resolved once at import time instead of per task
+_STATUS_DEFERRED = TaskStatus.DEFERRED.value
+
 
 @dataclass
 class PaginationConfig:
@@ -64,6 +82,10 @@ class TaskService:
         "isAcknowledged",
     }
 
+    # Listing totals drift slowly, so offset pages can reuse a recent count
+    # instead of re-counting the whole filter on every request
+    TASK_COUNT_CACHE_TTL = 30
+
     @classmethod
     def get_tasks(
         cls,
@@ -74,10 +96,21 @@ class TaskService:
         user_id: str,
         team_id: str = None,
         status_filter: str = None,
+        cursor: str = None,
     ) -> GetTasksResponse:
+        # Input validation runs before the repository try block so the narrow
+        # handler below only has to deal with storage failures
         try:
             cls._validate_pagination_params(page, limit)
+            cursor_filter = cls._decode_cursor(cursor) if cursor else None
+        except ValidationError as e:
+            return GetTasksResponse(
+                tasks=[],
+                links=None,
+                error={"message": str(e), "code": "VALIDATION_ERROR"},
+            )
 
+        try:
             # If team_id is provided, only allow team members to fetch tasks
             if team_id:
                 from todo.repositories.team_repository import TeamRepository
@@ -92,28 +125,88 @@ class TaskService:
                         },
                     )
 
-            tasks = TaskRepository.list(
-                page, limit, sort_by, order, user_id, team_id=team_id, status_filter=status_filter
-            )
-            total_count = TaskRepository.count(user_id, team_id=team_id, status_filter=status_filter)
+            if cursor:
+                tasks = TaskRepository.list(
+                    1,
+                    limit,
+                    sort_by,
+                    order,
+                    user_id,
+                    team_id=team_id,
+                    status_filter=status_filter,
+                    cursor=cursor_filter,
+                )
+
+                if not tasks:
+                    return GetTasksResponse(tasks=[], links=None)
+
+                # The repository fetched one look-ahead row past the page;
+                # its presence proves another page exists without a count
+                has_more = len(tasks) > limit
+                if has_more:
+                    tasks = tasks[:limit]
+
+                label_map, assignment_map, watchlist_map, user_map, team_map = cls._prefetch_page_context(
+                    tasks, user_id
+                )
+                now = datetime.now(timezone.utc)
+                task_dtos = [
+                    cls.prepare_task_dto(
+                        task,
+                        user_id,
+                        label_map=label_map,
+                        assignment_map=assignment_map,
+                        watchlist_map=watchlist_map,
+                        user_map=user_map,
+                        team_map=team_map,
+                        now=now,
+                    )
+                    for task in tasks
+                ]
+
+                next_cursor = cls._encode_cursor(tasks[-1]) if has_more and sort_by == SORT_FIELD_UPDATED_AT else None
+                return GetTasksResponse(tasks=task_dtos, links=None, next_cursor=next_cursor)
+
+            count_cache_key = cls._task_count_cache_key(user_id, team_id, status_filter)
+            total_count = cache.get(count_cache_key)
+            if total_count is None:
+                tasks, total_count = TaskRepository.list_with_count(
+                    page, limit, sort_by, order, user_id, team_id=team_id, status_filter=status_filter
+                )
+                cache.set(count_cache_key, total_count, cls.TASK_COUNT_CACHE_TTL)
+            else:
+                tasks = TaskRepository.list(
+                    page, limit, sort_by, order, user_id, team_id=team_id, status_filter=status_filter
+                )
 
             if not tasks:
                 return GetTasksResponse(tasks=[], links=None)
 
-            task_dtos = [cls.prepare_task_dto(task, user_id) for task in tasks]
+            label_map, assignment_map, watchlist_map, user_map, team_map = cls._prefetch_page_context(tasks, user_id)
+            now = datetime.now(timezone.utc)
+            task_dtos = [
+                cls.prepare_task_dto(
+                    task,
+                    user_id,
+                    label_map=label_map,
+                    assignment_map=assignment_map,
+                    watchlist_map=watchlist_map,
+                    user_map=user_map,
+                    team_map=team_map,
+                    now=now,
+                )
+                for task in tasks
+            ]
 
             links = cls._build_pagination_links(page, limit, total_count, sort_by, order)
 
-            return GetTasksResponse(tasks=task_dtos, links=links)
-
-        except ValidationError as e:
             return GetTasksResponse(
-                tasks=[],
-                links=None,
-                error={"message": str(e), "code": "VALIDATION_ERROR"},
+                tasks=task_dtos, links=links, next_cursor=cls._build_next_cursor(tasks, limit, sort_by)
             )
 
-        except Exception:
+        except (PyMongoError, BsonInvalidId):
+            # Anything else is a programming error and propagates to the
+            # middleware, which already renders a 500
             return GetTasksResponse(
                 tasks=[],
                 links=None,
@@ -150,35 +243,121 @@ class TaskService:
 
         return LinksData(next=next_link, prev=prev_link)
 
+    @classmethod
+    def _task_count_cache_key(cls, user_id: str, team_id: str, status_filter: str) -> str:
+        # The version stamp lets task writes drop every cached count at once
+        # without having to enumerate the per-filter keys
+        version = cache.get_or_set("tasks:count:version", 1, None)
+        return f"tasks:count:{version}:{user_id}:{team_id}:{status_filter}"
+
+    @classmethod
+    def _invalidate_task_counts(cls) -> None:
+        """Bump the version stamp so cached listing counts are abandoned."""
+        try:
+            cache.incr("tasks:count:version")
+        except ValueError:
+            cache.set("tasks:count:version", 1, None)
+
+    @classmethod
+    def _decode_cursor(cls, cursor: str) -> dict:
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor.encode()).decode())
+            return {
+                "lastActivity": datetime.fromisoformat(payload["lastActivity"]),
+                "_id": payload["_id"],
+            }
+        except (ValueError, KeyError, TypeError):
+            raise ValidationError(ValidationErrors.INVALID_CURSOR)
+
+    @classmethod
+    def _encode_cursor(cls, task: TaskModel) -> str:
+        last_activity = task.updatedAt or task.createdAt
+        payload = json.dumps({"lastActivity": last_activity.isoformat(), "_id": str(task.id)})
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    @classmethod
+    def _build_next_cursor(cls, tasks: List[TaskModel], limit: int, sort_by: str) -> str | None:
+        """Cursor for the page after the last returned task.
+
+        Only emitted for the lastActivity sort (the keyset the repository can
+        page on) and only when the page came back full, i.e. more results may
+        exist.
+        """
+        if sort_by != SORT_FIELD_UPDATED_AT or len(tasks) < limit:
+            return None
+        return cls._encode_cursor(tasks[-1])
+
+    _tasks_url = None
+
     @classmethod
     def build_page_url(cls, page: int, limit: int, sort_by: str, order: str) -> str:
-        base_url = reverse_lazy("tasks")
+        if cls._tasks_url is None:
+            # Resolved on first use (the URLconf is not loaded at import time)
+            # and reused so link building skips the resolver walk thereafter
+            cls._tasks_url = str(reverse_lazy("tasks"))
         query_params = urlencode({"page": page, "limit": limit, "sort_by": sort_by, "order": order})
-        return f"{base_url}?{query_params}"
+        return f"{cls._tasks_url}?{query_params}"
 
     @classmethod
-    def prepare_task_dto(cls, task_model: TaskModel, user_id: str = None) -> TaskDTO:
-        label_dtos = cls._prepare_label_dtos(task_model.labels) if task_model.labels else []
-        created_by = cls.prepare_user_dto(task_model.createdBy) if task_model.createdBy else None
-        updated_by = cls.prepare_user_dto(task_model.updatedBy) if task_model.updatedBy else None
+    def prepare_task_dto(
+        cls,
+        task_model: TaskModel,
+        user_id: str = None,
+        label_map: dict[str, LabelDTO] = None,
+        assignment_map: dict[str, TaskAssignmentModel] = None,
+        watchlist_map: dict[str, bool] = None,
+        user_map: dict[str, UserModel] = None,
+        team_map: dict[str, TeamModel] = None,
+        now: datetime = None,
+    ) -> TaskDTO:
+        # Single-task callers (writes returning the updated task) pass no
+        # maps; their independent fallback reads run concurrently on the
+        # prefetch pool while the rest of the DTO is assembled inline
+        assignment_future = None
+        if assignment_map is None:
+            assignment_future = _prefetch_executor.submit(TaskAssignmentRepository.get_by_task_id, str(task_model.id))
+        watchlist_future = None
+        if user_id and watchlist_map is None:
+            watchlist_future = _prefetch_executor.submit(
+                WatchlistRepository.get_by_user_and_task, user_id, str(task_model.id)
+            )
+
+        # List endpoints prefetch every label on the page once and pass the
+        # map in; the per-task query remains the single-task fallback
+        if not task_model.labels:
+            label_dtos = []
+        elif label_map is not None:
+            label_dtos = [label_map[str(label_id)] for label_id in task_model.labels if str(label_id) in label_map]
+        else:
+            label_dtos = cls._prepare_label_dtos(task_model.labels)
+        created_by = cls.prepare_user_dto(task_model.createdBy, user_map) if task_model.createdBy else None
+        updated_by = cls.prepare_user_dto(task_model.updatedBy, user_map) if task_model.updatedBy else None
         deferred_details = (
-            cls.prepare_deferred_details_dto(task_model.deferredDetails) if task_model.deferredDetails else None
+            cls.prepare_deferred_details_dto(task_model.deferredDetails, user_map)
+            if task_model.deferredDetails
+            else None
         )
 
-        assignee_details = TaskAssignmentRepository.get_by_task_id(str(task_model.id))
-        assignee_dto = cls._prepare_assignee_dto(assignee_details) if assignee_details else None
+        if assignment_map is not None:
+            assignee_details = assignment_map.get(str(task_model.id))
+        else:
+            assignee_details = assignment_future.result()
+        assignee_dto = cls._prepare_assignee_dto(assignee_details, user_map, team_map) if assignee_details else None
 
         # Check if task is in user's watchlist
         in_watchlist = None
         if user_id:
-            watchlist_entry = WatchlistRepository.get_by_user_and_task(user_id, str(task_model.id))
-            if watchlist_entry:
-                in_watchlist = watchlist_entry.isActive
+            if watchlist_map is not None:
+                in_watchlist = watchlist_map.get(str(task_model.id))
+            else:
+                watchlist_entry = watchlist_future.result()
+                if watchlist_entry:
+                    in_watchlist = watchlist_entry.isActive
 
         task_status = task_model.status
 
-        if task_model.deferredDetails and task_model.deferredDetails.deferredTill > datetime.now(timezone.utc):
-            task_status = TaskStatus.DEFERRED.value
+        if task_model.deferredDetails and task_model.deferredDetails.deferredTill > (now or datetime.now(timezone.utc)):
+            task_status = _STATUS_DEFERRED
 
         return TaskDTO(
             id=str(task_model.id),
@@ -200,6 +379,85 @@ class TaskService:
             updatedBy=updated_by,
         )
 
+    @classmethod
+    def _prefetch_page_context(
+        cls, tasks: List[TaskModel], user_id: str
+    ) -> tuple[
+        dict[str, LabelDTO],
+        dict[str, TaskAssignmentModel],
+        dict[str, bool],
+        dict[str, UserModel],
+        dict[str, TeamModel],
+    ]:
+        """Run the page's prefetch queries concurrently and return the maps.
+
+        Labels, assignments, and watchlist flags are independent and start
+        together; users and teams also need the assignment map (for assignees
+        missing a denormalized name), so they start once it resolves.
+        """
+        label_future = _prefetch_executor.submit(cls._prefetch_labels, tasks)
+        watchlist_future = _prefetch_executor.submit(cls._prefetch_watchlist_flags, tasks, user_id)
+        assignment_map = cls._prefetch_assignments(tasks)
+        user_future = _prefetch_executor.submit(cls._prefetch_users, tasks, assignment_map)
+        team_map = cls._prefetch_teams(assignment_map)
+        return label_future.result(), assignment_map, watchlist_future.result(), user_future.result(), team_map
+
+    @classmethod
+    def _prefetch_users(
+        cls, tasks: List[TaskModel], assignment_map: dict[str, TaskAssignmentModel] = None
+    ) -> dict[str, UserModel]:
+        """Fetch every user referenced by the page of tasks in one query."""
+        user_ids = set()
+        for task in tasks:
+            if task.createdBy:
+                user_ids.add(str(task.createdBy))
+            if task.updatedBy:
+                user_ids.add(str(task.updatedBy))
+            if task.deferredDetails and task.deferredDetails.deferredBy:
+                user_ids.add(str(task.deferredDetails.deferredBy))
+        for assignment in (assignment_map or {}).values():
+            if assignment.user_type == "user" and not assignment.assignee_name:
+                user_ids.add(str(assignment.assignee_id))
+        if not user_ids:
+            return {}
+        return UserRepository.list_by_ids(list(user_ids))
+
+    @classmethod
+    def _prefetch_teams(cls, assignment_map: dict[str, TaskAssignmentModel]) -> dict[str, TeamModel]:
+        """Fetch team assignees that lack a denormalized name in one query."""
+        team_ids = {
+            str(assignment.assignee_id)
+            for assignment in assignment_map.values()
+            if assignment.user_type == "team" and not assignment.assignee_name
+        }
+        if not team_ids:
+            return {}
+        return TeamRepository.list_by_ids(list(team_ids))
+
+    @classmethod
+    def _prefetch_watchlist_flags(cls, tasks: List[TaskModel], user_id: str) -> dict[str, bool]:
+        """Fetch the user's watchlist flags for the page of tasks in one query."""
+        if not user_id:
+            return {}
+        return WatchlistRepository.get_by_user_and_task_ids(user_id, [str(task.id) for task in tasks])
+
+    @classmethod
+    def _prefetch_assignments(cls, tasks: List[TaskModel]) -> dict[str, TaskAssignmentModel]:
+        """Fetch the active assignments for the page of tasks in one query."""
+        assignments = TaskAssignmentRepository.get_by_task_ids([str(task.id) for task in tasks])
+        return {str(assignment.task_id): assignment for assignment in assignments}
+
+    @classmethod
+    def _prefetch_labels(cls, tasks: List[TaskModel]) -> dict[str, LabelDTO]:
+        """Fetch every label referenced by the page of tasks in one query."""
+        label_ids = {label_id for task in tasks if task.labels for label_id in task.labels}
+        if not label_ids:
+            return {}
+        return {
+            str(label_model.id): LabelDTO(id=str(label_model.id), name=label_model.name, color=label_model.color)
+            for label_model in LabelRepository.list_by_ids(list(label_ids))
+        }
+
     @classmethod
     def _prepare_label_dtos(cls, label_ids: List[str]) -> List[LabelDTO]:
         label_models = LabelRepository.list_by_ids(label_ids)
@@ -214,42 +472,42 @@ class TaskService:
         ]
 
     @classmethod
-    def _prepare_assignee_dto(cls, assignee_details: TaskAssignmentModel) -> TaskAssignmentDTO:
+    def _prepare_assignee_dto(
+        cls,
+        assignee_details: TaskAssignmentModel,
+        user_map: dict[str, UserModel] = None,
+        team_map: dict[str, TeamModel] = None,
+    ) -> TaskAssignmentDTO:
         """Prepare assignee DTO from assignee task details."""
+        # Assignments written since names were denormalized carry the
+        # display name already; no user/team lookup is needed for them
+        if assignee_details.assignee_name:
+            return assignee_details.to_dto()
+
         assignee_id = str(assignee_details.assignee_id)
 
-        # Get assignee details based on user_type
+        # Get assignee details based on user_type; list endpoints preload
+        # the page's assignees, a map miss still falls back to the repository
         if assignee_details.user_type == "user":
-            assignee = UserRepository.get_by_id(assignee_id)
+            assignee = (user_map or {}).get(assignee_id) or UserRepository.get_by_id(assignee_id)
         elif assignee_details.user_type == "team":
-            assignee = TeamRepository.get_by_id(assignee_id)
+            assignee = (team_map or {}).get(assignee_id) or TeamRepository.get_by_id(assignee_id)
         else:
             return None
 
         if not assignee:
             return None
 
-        return TaskAssignmentDTO(
-            id=str(assignee_details.id),
-            task_id=str(assignee_details.task_id),
-            assignee_id=assignee_id,
-            assignee_name=assignee.name,
-            user_type=assignee_details.user_type,
-            executor_id=str(assignee_details.executor_id) if assignee_details.executor_id else None,
-            team_id=str(assignee_details.team_id) if assignee_details.team_id else None,
-            is_active=assignee_details.is_active,
-            created_by=str(assignee_details.created_by),
-            updated_by=str(assignee_details.updated_by) if assignee_details.updated_by else None,
-            created_at=assignee_details.created_at,
-            updated_at=assignee_details.updated_at,
-        )
+        return assignee_details.to_dto(assignee.name)
 
     @classmethod
-    def prepare_deferred_details_dto(cls, deferred_details_model: DeferredDetailsModel) -> DeferredDetailsDTO | None:
+    def prepare_deferred_details_dto(
+        cls, deferred_details_model: DeferredDetailsModel, user_map: dict[str, UserModel] = None
+    ) -> DeferredDetailsDTO | None:
         if not deferred_details_model:
             return None
 
-        deferred_by_user = cls.prepare_user_dto(deferred_details_model.deferredBy)
+        deferred_by_user = cls.prepare_user_dto(deferred_details_model.deferredBy, user_map)
 
         return DeferredDetailsDTO(
             deferredAt=deferred_details_model.deferredAt,
@@ -258,8 +516,12 @@ class TaskService:
         )
 
     @classmethod
-    def prepare_user_dto(cls, user_id: str) -> UserDTO:
-        user = UserRepository.get_by_id(user_id)
+    def prepare_user_dto(cls, user_id: str, user_map: dict[str, UserModel] = None) -> UserDTO:
+        # List endpoints preload the page's users; a map miss still falls
+        # back to the repository so a stale map cannot hide a valid user
+        user = user_map.get(str(user_id)) if user_map else None
+        if user is None:
+            user = UserRepository.get_by_id(user_id)
         if user:
             return UserDTO(id=str(user_id), name=user.name)
         raise UserNotFoundException(user_id)
@@ -275,64 +537,111 @@ class TaskService:
             raise exc
 
     @classmethod
-    def _process_labels_for_update(cls, raw_labels: list | None) -> list[PyObjectId]:
+    def _process_labels_for_update(cls, raw_labels: list | None) -> list[ObjectId]:
         if raw_labels is None:
             return []
 
-        label_object_ids = [PyObjectId(label_id_str) for label_id_str in raw_labels]
-        return label_object_ids
+        # ObjectId directly: it is what the driver encodes, validates the
+        # 24-hex form in C, and skips the PyObjectId subclass indirection
+        return [ObjectId(label_id_str) for label_id_str in raw_labels]
 
     @classmethod
-    def _process_enum_for_update(cls, enum_type: type, value: str | None) -> str | None:
+    def _process_enum_for_update(cls, enum_type: type, value) -> str | None:
         if value is None:
             return None
+        if isinstance(value, enum_type):
+            return value.value
         return enum_type[value].value
 
     @classmethod
-    def update_task(cls, task_id: str, validated_data: dict, user_id: str) -> TaskDTO:
-        current_task = TaskRepository.get_by_id(task_id)
+    def _assert_can_modify(cls, current_task: TaskModel, user_id: str) -> None:
+        """Creators may always modify; anyone else must be assigned.
+
+        The assignment lookup only runs for non-creators, and membership is
+        checked against the repository's id set in O(1).
+        """
+        if current_task.createdBy == user_id:
+            return
+        assigned_task_ids = TaskRepository._get_assigned_task_ids_for_user(user_id)
+        if current_task.id not in assigned_task_ids:
+            raise PermissionError(ApiErrors.UNAUTHORIZED_TITLE)
 
+    @classmethod
+    def _modify_authz_filter(cls, current_task: TaskModel, user_id: str) -> dict:
+        """Authorization predicate enforced atomically on the write itself."""
+        if current_task.createdBy == user_id:
+            return {"createdBy": user_id}
+        return {"_id": {"$in": list(TaskRepository._get_assigned_task_ids_for_user(user_id))}}
+
+    @classmethod
+    def _raise_update_miss(cls, task_id: str) -> None:
+        # The guarded write matched nothing: either the task vanished or
+        # permission was revoked between the pre-check and the write
+        if TaskRepository.exists(task_id):
+            raise PermissionError(ApiErrors.UNAUTHORIZED_TITLE)
+        raise TaskNotFoundException(task_id)
+
+    @classmethod
+    def _load_task_for_update(cls, task_id: str, user_id: str) -> TaskModel:
+        current_task = TaskRepository.get_by_id(task_id)
         if not current_task:
             raise TaskNotFoundException(task_id)
+        cls._assert_can_modify(current_task, user_id)
+        return current_task
 
-        # Check if user is the creator
-        if current_task.createdBy != user_id:
-            # Check if user is assigned to this task
-            assigned_task_ids = TaskRepository._get_assigned_task_ids_for_user(user_id)
-            if current_task.id not in assigned_task_ids:
-                raise PermissionError(ApiErrors.UNAUTHORIZED_TITLE)
+    @classmethod
+    def _validate_assignee_info(cls, assignee_info: dict) -> None:
+        assignee_id = assignee_info.get("assignee_id")
+        user_type = assignee_info.get("user_type")
 
-        # Handle assignee updates if provided
-        if validated_data.get("assignee"):
-            assignee_info = validated_data["assignee"]
-            assignee_id = assignee_info.get("assignee_id")
-            user_type = assignee_info.get("user_type")
+        if user_type == "user":
+            if not UserRepository.get_by_id(assignee_id):
+                raise UserNotFoundException(assignee_id)
+        elif user_type == "team":
+            if not TeamRepository.get_by_id(assignee_id):
+                raise ValueError(f"Team not found: {assignee_id}")
 
-            if user_type == "user":
-                assignee_data = UserRepository.get_by_id(assignee_id)
-                if not assignee_data:
-                    raise UserNotFoundException(assignee_id)
-            elif user_type == "team":
-                team_data = TeamRepository.get_by_id(assignee_id)
-                if not team_data:
-                    raise ValueError(f"Team not found: {assignee_id}")
+    @classmethod
+    def _normalize_update_payload(cls, validated_data: dict, current_task: TaskModel = None) -> dict:
+        """Run updatable fields through the handler table.
+
+        When current_task is given, fields whose value matches the current
+        one are skipped, keeping partial updates minimal.
+        """
+        update_payload = {}
+        for field, value in validated_data.items():
+            if current_task is not None and getattr(current_task, field, None) == value:
+                continue
+            handler = _UPDATE_FIELD_HANDLERS.get(field)
+            if handler:
+                update_payload[field] = handler(value)
+        return update_payload
+
+    @classmethod
+    def _apply_update(cls, task_id: str, current_task: TaskModel, update_payload: dict, user_id: str) -> TaskModel:
+        """Write the guarded update; an empty payload returns the task as is."""
+        if not update_payload:
+            return current_task
+        update_payload["updatedBy"] = user_id
+        updated_task = TaskRepository.update(
+            task_id, update_payload, authz_filter=cls._modify_authz_filter(current_task, user_id)
+        )
+        if not updated_task:
+            cls._raise_update_miss(task_id)
+        return updated_task
+
+    @classmethod
+    def update_task(cls, task_id: str, validated_data: dict, user_id: str) -> TaskDTO:
+        current_task = cls._load_task_for_update(task_id, user_id)
+
+        if validated_data.get("assignee"):
+            cls._validate_assignee_info(validated_data["assignee"])
 
         # Track status change for audit log
         old_status = getattr(current_task, "status", None)
         new_status = validated_data.get("status")
 
-        update_payload = {}
-        enum_fields = {"priority": TaskPriority, "status": TaskStatus}
-
-        for field, value in validated_data.items():
-            if field == "labels":
-                update_payload[field] = cls._process_labels_for_update(
-                    value
-                )  # Only convert to ObjectId, do not check existence
-            elif field in enum_fields:
-                update_payload[field] = cls._process_enum_for_update(enum_fields[field], value)
-            elif field in cls.DIRECT_ASSIGNMENT_FIELDS:
-                update_payload[field] = value
+        update_payload = cls._normalize_update_payload(validated_data)
 
         # Handle assignee updates separately
         if "assignee" in validated_data:
@@ -347,11 +656,12 @@ class TaskService:
         if not update_payload:
             return cls.prepare_task_dto(current_task, user_id)
 
-        update_payload["updatedBy"] = user_id
-        updated_task = TaskRepository.update(task_id, update_payload)
+        updated_task = cls._apply_update(task_id, current_task, update_payload, user_id)
 
         # Audit log for status change
         if old_status and new_status and old_status != new_status:
+            # Status moves shift the status-filtered listing totals
+            cls._invalidate_task_counts()
             AuditLogRepository.create(
                 AuditLogModel(
                     task_id=current_task.id,
@@ -362,9 +672,6 @@ class TaskService:
                 )
             )
 
-        if not updated_task:
-            raise TaskNotFoundException(task_id)
-
         return cls.prepare_task_dto(updated_task, user_id)
 
     @classmethod
@@ -373,57 +680,12 @@ class TaskService:
         Update both task details and assignee information in a single operation using validated data dict.
         This allows for true partial updates without requiring all fields.
         """
-        current_task = TaskRepository.get_by_id(task_id)
-
-        if not current_task:
-            raise TaskNotFoundException(task_id)
+        current_task = cls._load_task_for_update(task_id, user_id)
 
-        # Check if user is the creator
-        if current_task.createdBy != user_id:
-            # Check if user is assigned to this task
-            assigned_task_ids = TaskRepository._get_assigned_task_ids_for_user(user_id)
-            if current_task.id not in assigned_task_ids:
-                raise PermissionError(ApiErrors.UNAUTHORIZED_TITLE)
-
-        # Validate assignee if provided
         if validated_data.get("assignee"):
-            assignee_info = validated_data["assignee"]
-            assignee_id = assignee_info.get("assignee_id")
-            user_type = assignee_info.get("user_type")
-
-            if user_type == "user":
-                user_data = UserRepository.get_by_id(assignee_id)
-                if not user_data:
-                    raise UserNotFoundException(assignee_id)
-            elif user_type == "team":
-                team_data = TeamRepository.get_by_id(assignee_id)
-                if not team_data:
-                    raise ValueError(f"Team not found: {assignee_id}")
+            cls._validate_assignee_info(validated_data["assignee"])
 
-        # Prepare update payload for task fields
-        update_payload = {}
-        enum_fields = {"priority": TaskPriority, "status": TaskStatus}
-
-        # Process task fields from validated_data
-        for field, value in validated_data.items():
-            if field == "assignee":
-                continue  # Handle assignee separately
-
-            # Skip if the value is the same as current task
-            current_value = getattr(current_task, field, None)
-            if current_value == value:
-                continue
-
-            if field == "labels":
-                update_payload[field] = cls._process_labels_for_update(value)
-            elif field in enum_fields:
-                # For enums, we need to get the name if it's an enum instance, or process as string
-                if hasattr(value, "name"):
-                    update_payload[field] = value.value
-                else:
-                    update_payload[field] = cls._process_enum_for_update(enum_fields[field], value)
-            elif field in cls.DIRECT_ASSIGNMENT_FIELDS:
-                update_payload[field] = value
+        update_payload = cls._normalize_update_payload(validated_data, current_task)
 
         # Handle startedAt logic
         if validated_data.get("status") == TaskStatus.IN_PROGRESS and not current_task.startedAt:
@@ -431,22 +693,15 @@ class TaskService:
 
         if (
             validated_data.get("status") is not None
-            and validated_data.get("status") != TaskStatus.DEFERRED.value
+            and validated_data.get("status") != _STATUS_DEFERRED
             and current_task.deferredDetails
         ):
             update_payload["deferredDetails"] = None
 
-        if validated_data.get("status") == TaskStatus.DEFERRED.value:
+        if validated_data.get("status") == _STATUS_DEFERRED:
             update_payload["status"] = current_task.status
 
-        # Update task if there are changes
-        if update_payload:
-            update_payload["updatedBy"] = user_id
-            updated_task = TaskRepository.update(task_id, update_payload)
-            if not updated_task:
-                raise TaskNotFoundException(task_id)
-        else:
-            updated_task = current_task
+        updated_task = cls._apply_update(task_id, current_task, update_payload, user_id)
 
         # Handle assignee updates
         if validated_data.get("assignee"):
@@ -465,68 +720,20 @@ class TaskService:
         Update both task details and assignee information in a single operation.
         Similar to create_task but for updates.
         """
-        current_task = TaskRepository.get_by_id(task_id)
-
-        if not current_task:
-            raise TaskNotFoundException(task_id)
-
-        # Check if user is the creator
-        if current_task.createdBy != user_id:
-            # Check if user is assigned to this task
-            assigned_task_ids = TaskRepository._get_assigned_task_ids_for_user(user_id)
-            if current_task.id not in assigned_task_ids:
-                raise PermissionError(ApiErrors.UNAUTHORIZED_TITLE)
+        current_task = cls._load_task_for_update(task_id, user_id)
 
-        # Validate assignee if provided
         if dto.assignee:
-            assignee_id = dto.assignee.get("assignee_id")
-            user_type = dto.assignee.get("user_type")
-
-            if user_type == "user":
-                user_data = UserRepository.get_by_id(assignee_id)
-                if not user_data:
-                    raise UserNotFoundException(assignee_id)
-            elif user_type == "team":
-                team_data = TeamRepository.get_by_id(assignee_id)
-                if not team_data:
-                    raise ValueError(f"Team not found: {assignee_id}")
-
-        # Prepare update payload for task fields
-        update_payload = {}
-        enum_fields = {"priority": TaskPriority, "status": TaskStatus}
-
-        # Process task fields from DTO
-        dto_data = dto.model_dump(exclude_none=True, exclude={"assignee", "createdBy"})
+            cls._validate_assignee_info(dto.assignee)
 
-        for field, value in dto_data.items():
-            # Skip if the value is the same as current task
-            current_value = getattr(current_task, field, None)
-            if current_value == value:
-                continue
-
-            if field == "labels":
-                update_payload[field] = cls._process_labels_for_update(value)
-            elif field in enum_fields:
-                # For enums, we need to get the name if it's an enum instance, or process as string
-                if hasattr(value, "name"):
-                    update_payload[field] = value.value
-                else:
-                    update_payload[field] = cls._process_enum_for_update(enum_fields[field], value)
-            elif field in cls.DIRECT_ASSIGNMENT_FIELDS:
-                update_payload[field] = value
+        update_payload = cls._normalize_update_payload(
+            dto.model_dump(exclude_none=True, exclude={"assignee", "createdBy"}), current_task
+        )
 
         # Handle startedAt logic
         if dto.status == TaskStatus.IN_PROGRESS and not current_task.startedAt:
             update_payload["startedAt"] = datetime.now(timezone.utc)
 
-        # Update task if there are changes
-        if update_payload:
-            update_payload["updatedBy"] = user_id
-            updated_task = TaskRepository.update(task_id, update_payload)
-            if not updated_task:
-                raise TaskNotFoundException(task_id)
-        else:
-            updated_task = current_task
+        updated_task = cls._apply_update(task_id, current_task, update_payload, user_id)
 
         # Handle assignee updates
         if dto.assignee:
@@ -541,17 +748,7 @@ class TaskService:
 
     @classmethod
     def defer_task(cls, task_id: str, deferred_till: datetime, user_id: str) -> TaskDTO:
-        current_task = TaskRepository.get_by_id(task_id)
-
-        if not current_task:
-            raise TaskNotFoundException(task_id)
-
-        # Check if user is the creator
-        if current_task.createdBy != user_id:
-            # Check if user is assigned to this task
-            assigned_task_ids = TaskRepository._get_assigned_task_ids_for_user(user_id)
-            if current_task.id not in assigned_task_ids:
-                raise PermissionError(ApiErrors.UNAUTHORIZED_TITLE)
+        current_task = cls._load_task_for_update(task_id, user_id)
 
         if current_task.status == TaskStatus.DONE:
             raise TaskStateConflictException(ValidationErrors.CANNOT_DEFER_A_DONE_TASK)
@@ -572,21 +769,24 @@ class TaskService:
                     source={ApiErrorSource.PARAMETER: "deferredTill"},
                 )
 
-        deferred_details = DeferredDetailsModel(
-            deferredAt=datetime.now(timezone.utc),
-            deferredTill=deferred_till,
-            deferredBy=user_id,
-        )
-
+        # Plain dict matching DeferredDetailsModel's three fields; the values
+        # are already validated, so the pydantic construct/dump pass adds
+        # nothing on this write path
         update_payload = {
             "status": TaskStatus.TODO.value,
-            "deferredDetails": deferred_details.model_dump(),
+            "deferredDetails": {
+                "deferredAt": datetime.now(timezone.utc),
+                "deferredTill": deferred_till,
+                "deferredBy": user_id,
+            },
             "updatedBy": user_id,
         }
 
-        updated_task = TaskRepository.update(task_id, update_payload)
+        updated_task = TaskRepository.update(
+            task_id, update_payload, authz_filter=cls._modify_authz_filter(current_task, user_id)
+        )
         if not updated_task:
-            raise TaskNotFoundException(task_id)
+            cls._raise_update_miss(task_id)
 
         return cls.prepare_task_dto(updated_task, user_id)
 
@@ -602,13 +802,14 @@ class TaskService:
             team_id = dto.assignee.get("team_id")
 
             if user_type == "user":
+                # The user and team checks are independent reads, so when a
+                # team scope is given the team lookup overlaps the user one
+                team_future = _prefetch_executor.submit(TeamRepository.get_by_id, team_id) if team_id else None
                 user = UserRepository.get_by_id(assignee_id)
                 if not user:
                     raise UserNotFoundException(assignee_id)
-                if team_id:
-                    team = TeamRepository.get_by_id(team_id)
-                    if not team:
-                        raise ValueError(f"Team not found: {team_id}")
+                if team_future and not team_future.result():
+                    raise ValueError(f"Team not found: {team_id}")
             elif user_type == "team":
                 team = TeamRepository.get_by_id(assignee_id)
                 if not team:
@@ -633,6 +834,7 @@ class TaskService:
 
         try:
             created_task = TaskRepository.create(task)
+            cls._invalidate_task_counts()
 
             # Create assignee relationship if assignee is provided
             team_id = None
@@ -688,6 +890,7 @@ class TaskService:
         deleted_task_model = TaskRepository.delete_by_id(task_id, user_id)
         if deleted_task_model is None:
             raise TaskNotFoundException(task_id)
+        cls._invalidate_task_counts()
         return None
 
     @classmethod
@@ -703,5 +906,31 @@ class TaskService:
         if not tasks:
             return GetTasksResponse(tasks=[], links=None)
 
-        task_dtos = [cls.prepare_task_dto(task, user_id) for task in tasks]
+        label_map, assignment_map, watchlist_map, user_map, team_map = cls._prefetch_page_context(tasks, user_id)
+        now = datetime.now(timezone.utc)
+        task_dtos = [
+            cls.prepare_task_dto(
+                task,
+                user_id,
+                label_map=label_map,
+                assignment_map=assignment_map,
+                watchlist_map=watchlist_map,
+                user_map=user_map,
+                team_map=team_map,
+                now=now,
+            )
+            for task in tasks
+        ]
         return GetTasksResponse(tasks=task_dtos, links=None)
+
+
+# Single-lookup dispatch for building update payloads: updatable fields map
+# to their processing callable (labels only convert to ObjectId, existence is
+# not checked), direct-assignment fields pass through unchanged, and anything
+# absent from the table is ignored.
+_UPDATE_FIELD_HANDLERS: dict[str, Callable] = {
+    "labels": TaskService._process_labels_for_update,
+    "priority": partial(TaskService._process_enum_for_update, TaskPriority),
+    "status": partial(TaskService._process_enum_for_update, TaskStatus),
+    **{field: lambda value: value for field in TaskService.DIRECT_ASSIGNMENT_FIELDS},
+}
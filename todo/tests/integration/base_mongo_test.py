@@ -1,9 +1,12 @@
 from datetime import datetime, timezone
+from unittest.mock import patch
 from bson import ObjectId
-from django.test import TransactionTestCase, override_settings
+from django.test import SimpleTestCase, TransactionTestCase, override_settings
 from django.conf import settings
+from django.core.cache import cache
 from pymongo import MongoClient
 from todo.models.user import UserModel
+from todo.repositories.user_repository import UserRepository
 from todo.tests.testcontainers.shared_mongo import get_shared_mongo_container
 from todo.utils.jwt_utils import generate_token_pair
 from todo_project.db.config import DatabaseManager
@@ -38,14 +41,10 @@ class BaseMongoTestCase(TransactionTestCase):
         super().tearDownClass()
 
 
-class AuthenticatedMongoTestCase(BaseMongoTestCase):
-    def setUp(self):
-        super().setUp()
-        self.client = APIClient()
-        self._create_test_user()
-        self._set_auth_cookies()
+class AuthenticatedClientMixin:
+    """Auth fixture shared by the Mongo-backed and no-DB test cases."""
 
-    def _create_test_user(self, userId=None):
+    def _build_test_user(self, userId=None):
         if userId is None:
             self.user_id = ObjectId()
         else:
@@ -56,6 +55,33 @@ class AuthenticatedMongoTestCase(BaseMongoTestCase):
             "user_id": str(self.user_id),
         }
 
+    def _set_auth_cookies(self):
+        tokens = generate_token_pair(self.user_data)
+        self.client.cookies[settings.COOKIE_SETTINGS.get("ACCESS_COOKIE_NAME")] = tokens["access_token"]
+        self.client.cookies[settings.COOKIE_SETTINGS.get("REFRESH_COOKIE_NAME")] = tokens["refresh_token"]
+
+    def get_user_model(self) -> UserModel:
+        return UserModel(
+            id=self.user_id,
+            google_id=self.user_data["google_id"],
+            email_id=self.user_data["email"],
+            name=self.user_data["name"],
+            picture=self.user_data["picture"],
+            createdAt=datetime.now(timezone.utc),
+            updatedAt=datetime.now(timezone.utc),
+        )
+
+
+class AuthenticatedMongoTestCase(AuthenticatedClientMixin, BaseMongoTestCase):
+    def setUp(self):
+        super().setUp()
+        self.client = APIClient()
+        self._create_test_user()
+        self._set_auth_cookies()
+
+    def _create_test_user(self, userId=None):
+        self._build_test_user(userId)
+
         self.db.users.insert_one(
             {
                 "_id": self.user_id,
@@ -68,18 +94,50 @@ class AuthenticatedMongoTestCase(BaseMongoTestCase):
             }
         )
 
-    def _set_auth_cookies(self):
-        tokens = generate_token_pair(self.user_data)
-        self.client.cookies[settings.COOKIE_SETTINGS.get("ACCESS_COOKIE_NAME")] = tokens["access_token"]
-        self.client.cookies[settings.COOKIE_SETTINGS.get("REFRESH_COOKIE_NAME")] = tokens["refresh_token"]
 
-    def get_user_model(self) -> UserModel:
-        return UserModel(
-            id=self.user_id,
-            google_id=self.user_data["google_id"],
-            email_id=self.user_data["email"],
-            name=self.user_data["name"],
-            picture=self.user_data["picture"],
+class AuthenticatedNoDBTestCase(AuthenticatedClientMixin, SimpleTestCase):
+    """Auth fixture without the Mongo container.
+
+    For test classes that mock the repository or service layer and never
+    touch the database, the container bootstrap, index creation, and
+    per-test collection wipe of BaseMongoTestCase are pure overhead. The
+    JWT middleware still verifies the token's user id against the user
+    repository, so that single lookup is served from the fixture instead.
+
+    The auth context never changes between mocked tests, so the user and
+    signed tokens are built once per class; setUp only reattaches the
+    cookies to the fresh client the test harness creates per test.
+    """
+
+    client_class = APIClient
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.user_id = ObjectId()
+        cls.user_data = {
+            **google_auth_user_payload,
+            "user_id": str(cls.user_id),
+        }
+        cls._auth_tokens = generate_token_pair(cls.user_data)
+
+        auth_user = UserModel(
+            id=cls.user_id,
+            google_id=cls.user_data["google_id"],
+            email_id=cls.user_data["email"],
+            name=cls.user_data["name"],
+            picture=cls.user_data["picture"],
             createdAt=datetime.now(timezone.utc),
             updatedAt=datetime.now(timezone.utc),
         )
+        auth_user_patcher = patch.object(UserRepository, "get_by_id", return_value=auth_user)
+        auth_user_patcher.start()
+        cls.addClassCleanup(auth_user_patcher.stop)
+
+    def setUp(self):
+        super().setUp()
+        # Service-level caches (listing counts, user lookups) key on the
+        # class-wide user id and must not leak between tests
+        cache.clear()
+        self.client.cookies[settings.COOKIE_SETTINGS.get("ACCESS_COOKIE_NAME")] = self._auth_tokens["access_token"]
+        self.client.cookies[settings.COOKIE_SETTINGS.get("REFRESH_COOKIE_NAME")] = self._auth_tokens["refresh_token"]
@@ -1,6 +1,11 @@
-from unittest.mock import patch, Mock
+from unittest.mock import call, patch
+from django.urls import reverse
 from rest_framework import status
-from todo.tests.integration.base_mongo_test import AuthenticatedMongoTestCase
+from rest_framework.test import APIRequestFactory
+from todo.repositories.task_repository import TaskRepository
+from todo.serializers.get_tasks_serializer import GetTaskQueryParamsSerializer
+from todo.views.task import TaskListView
+from todo.tests.integration.base_mongo_test import AuthenticatedNoDBTestCase
 from todo.constants.task import (
     SORT_FIELD_PRIORITY,
     SORT_FIELD_DUE_AT,
@@ -12,58 +17,78 @@ from todo.constants.task import (
 )
 
 
-class TaskSortingIntegrationTest(AuthenticatedMongoTestCase):
+def _expected_list_call(user_id, sort=SORT_FIELD_UPDATED_AT, order=SORT_ORDER_DESC, page=1, limit=20):
+    """The repository call the listing endpoint is expected to make.
+
+    Keeps the long positional/keyword shape in one place instead of
+    rebuilding it in every assertion.
+    """
+    return call(page, limit, sort, order, str(user_id), team_id=None, status_filter=None)
+
+
+class TaskSortingIntegrationTest(AuthenticatedNoDBTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # One class-level patcher instead of re-entering patch() in every
+        # test; per-test cost drops to resetting the shared mock
+        cls._list_with_count_patcher = patch.object(TaskRepository, "list_with_count", return_value=([], 0))
+        cls.mock_list_with_count = cls._list_with_count_patcher.start()
+        cls.addClassCleanup(cls._list_with_count_patcher.stop)
+        cls.tasks_url = reverse("tasks")
+        # Parameter-validation tests dispatch the view directly; rejection
+        # happens in the serializer, before auth middleware would matter
+        cls.factory = APIRequestFactory()
+        cls.view = staticmethod(TaskListView.as_view())
+        # The page prefetch repositories are patched once for the class;
+        # only the links test returns tasks, the rest never reach them
+        for target, empty in (
+            ("todo.services.task_service.LabelRepository.list_by_ids", []),
+            ("todo.services.task_service.TaskAssignmentRepository.get_by_task_ids", []),
+            ("todo.services.task_service.WatchlistRepository.get_by_user_and_task_ids", {}),
+            ("todo.services.task_service.UserRepository.list_by_ids", {}),
+        ):
+            prefetch_patcher = patch(target, return_value=empty)
+            prefetch_patcher.start()
+            cls.addClassCleanup(prefetch_patcher.stop)
+
     def setUp(self):
         super().setUp()
+        self.mock_list_with_count.reset_mock()
+        self.mock_list_with_count.return_value = ([], 0)
 
-    @patch("todo.repositories.task_repository.TaskRepository.count")
-    @patch("todo.repositories.task_repository.TaskRepository.list")
-    def test_priority_sorting_integration(self, mock_list, mock_count):
-        mock_list.return_value = []
-        mock_count.return_value = 0
-
-        response = self.client.get("/v1/tasks", {"sort_by": "priority", "order": "desc"})
+    def test_priority_sorting_integration(self):
+        response = self.client.get(self.tasks_url, {"sort_by": "priority", "order": "desc"})
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        mock_list.assert_called_with(
-            1, 20, SORT_FIELD_PRIORITY, SORT_ORDER_DESC, str(self.user_id), team_id=None, status_filter=None
+        self.assertEqual(
+            self.mock_list_with_count.call_args,
+            _expected_list_call(self.user_id, sort=SORT_FIELD_PRIORITY, order=SORT_ORDER_DESC),
         )
 
-    @patch("todo.repositories.task_repository.TaskRepository.count")
-    @patch("todo.repositories.task_repository.TaskRepository.list")
-    def test_due_at_default_order_integration(self, mock_list, mock_count):
-        mock_list.return_value = []
-        mock_count.return_value = 0
-
-        response = self.client.get("/v1/tasks", {"sort_by": "dueAt"})
+    def test_due_at_default_order_integration(self):
+        response = self.client.get(self.tasks_url, {"sort_by": "dueAt"})
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        mock_list.assert_called_with(
-            1, 20, SORT_FIELD_DUE_AT, SORT_ORDER_ASC, str(self.user_id), team_id=None, status_filter=None
+        self.assertEqual(
+            self.mock_list_with_count.call_args,
+            _expected_list_call(self.user_id, sort=SORT_FIELD_DUE_AT, order=SORT_ORDER_ASC),
         )
 
-    @patch("todo.repositories.task_repository.TaskRepository.count")
-    @patch("todo.repositories.task_repository.TaskRepository.list")
-    def test_assignee_sorting_uses_aggregation(self, mock_list, mock_count):
-        mock_list.return_value = []
-        mock_count.return_value = 0
-
-        response = self.client.get("/v1/tasks", {"sort_by": "assignee", "order": "asc"})
+    def test_assignee_sorting_uses_aggregation(self):
+        response = self.client.get(self.tasks_url, {"sort_by": "assignee", "order": "asc"})
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
         # Assignee sorting now falls back to createdAt sorting
-        mock_list.assert_called_once_with(
-            1, 20, SORT_FIELD_ASSIGNEE, SORT_ORDER_ASC, str(self.user_id), team_id=None, status_filter=None
+        self.assertEqual(self.mock_list_with_count.call_count, 1)
+        self.assertEqual(
+            self.mock_list_with_count.call_args,
+            _expected_list_call(self.user_id, sort=SORT_FIELD_ASSIGNEE, order=SORT_ORDER_ASC),
         )
 
-    @patch("todo.repositories.task_repository.TaskRepository.count")
-    @patch("todo.repositories.task_repository.TaskRepository.list")
-    def test_field_specific_defaults_integration(self, mock_list, mock_count):
-        mock_list.return_value = []
-        mock_count.return_value = 0
-
+    def test_field_specific_defaults_integration(self):
         test_cases = [
             (SORT_FIELD_CREATED_AT, SORT_ORDER_DESC),
             (SORT_FIELD_UPDATED_AT, SORT_ORDER_DESC),
@@ -72,83 +97,69 @@ class TaskSortingIntegrationTest(AuthenticatedMongoTestCase):
             (SORT_FIELD_ASSIGNEE, SORT_ORDER_ASC),
         ]
 
+        # The default-order mapping lives in the query serializer, so assert
+        # it there instead of driving the whole HTTP stack per sort field
         for sort_field, expected_order in test_cases:
             with self.subTest(sort_field=sort_field, expected_order=expected_order):
-                mock_list.reset_mock()
-                mock_count.reset_mock()
+                serializer = GetTaskQueryParamsSerializer(data={"sort_by": sort_field})
+                serializer.is_valid(raise_exception=True)
+                self.assertEqual(serializer.validated_data["order"], expected_order)
 
-                response = self.client.get("/v1/tasks", {"sort_by": sort_field})
+        # One full round-trip as a contract check that the view forwards the
+        # serializer's default order to the repository
+        response = self.client.get(self.tasks_url, {"sort_by": SORT_FIELD_DUE_AT})
 
-                self.assertEqual(response.status_code, status.HTTP_200_OK)
-                mock_list.assert_called_with(
-                    1, 20, sort_field, expected_order, str(self.user_id), team_id=None, status_filter=None
-                )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            self.mock_list_with_count.call_args,
+            _expected_list_call(self.user_id, sort=SORT_FIELD_DUE_AT, order=SORT_ORDER_ASC),
+        )
 
-    @patch("todo.repositories.task_repository.TaskRepository.count")
-    @patch("todo.repositories.task_repository.TaskRepository.list")
-    def test_pagination_with_sorting_integration(self, mock_list, mock_count):
-        mock_list.return_value = []
-        mock_count.return_value = 100
+    def test_pagination_with_sorting_integration(self):
+        self.mock_list_with_count.return_value = ([], 100)
 
-        response = self.client.get("/v1/tasks", {"page": "3", "limit": "5", "sort_by": "createdAt", "order": "asc"})
+        response = self.client.get(self.tasks_url, {"page": "3", "limit": "5", "sort_by": "createdAt", "order": "asc"})
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        mock_list.assert_called_with(
-            3, 5, SORT_FIELD_CREATED_AT, SORT_ORDER_ASC, str(self.user_id), team_id=None, status_filter=None
+        self.assertEqual(
+            self.mock_list_with_count.call_args,
+            _expected_list_call(self.user_id, sort=SORT_FIELD_CREATED_AT, order=SORT_ORDER_ASC, page=3, limit=5),
         )
 
     def test_invalid_sort_parameters_integration(self):
-        response = self.client.get("/v1/tasks", {"sort_by": "invalid_field"})
+        response = self.view(self.factory.get(self.tasks_url, {"sort_by": "invalid_field"}))
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
-        response = self.client.get("/v1/tasks", {"sort_by": "priority", "order": "invalid_order"})
+        response = self.view(self.factory.get(self.tasks_url, {"sort_by": "priority", "order": "invalid_order"}))
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
-    @patch("todo.repositories.task_repository.TaskRepository.count")
-    @patch("todo.repositories.task_repository.TaskRepository.list")
-    def test_default_behavior_integration(self, mock_list, mock_count):
-        mock_list.return_value = []
-        mock_count.return_value = 0
-
-        response = self.client.get("/v1/tasks")
+    def test_default_behavior_integration(self):
+        response = self.client.get(self.tasks_url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        mock_list.assert_called_with(
-            1, 20, SORT_FIELD_UPDATED_AT, SORT_ORDER_DESC, str(self.user_id), team_id=None, status_filter=None
+        self.assertEqual(
+            self.mock_list_with_count.call_args,
+            _expected_list_call(self.user_id),
         )
 
-    @patch("todo.repositories.user_repository.UserRepository.get_by_id")
-    @patch("todo.services.task_service.reverse_lazy", return_value="/v1/tasks")
-    @patch("todo.repositories.task_repository.TaskRepository.count")
-    @patch("todo.repositories.task_repository.TaskRepository.list")
-    def test_pagination_links_preserve_sort_params_integration(
-        self, mock_list, mock_count, mock_reverse, mock_user_repo
-    ):
+    def test_pagination_links_preserve_sort_params_integration(self):
         from todo.tests.fixtures.task import tasks_models
 
-        from todo.models.user import UserModel
+        # User lookups are already served by the class-wide auth-user patch,
+        # and the prefetch repositories by the class-wide empty patchers
+        self.mock_list_with_count.return_value = (([tasks_models[0]] if tasks_models else []), 3)
 
-        mock_user = Mock(spec=UserModel)
-        mock_user.email_id = "test@example.com"
-        mock_user_repo.return_value = mock_user
+        response = self.client.get(self.tasks_url, {"page": "2", "limit": "1", "sort_by": "priority", "order": "desc"})
 
-        mock_list.return_value = [tasks_models[0]] if tasks_models else []
-        mock_count.return_value = 3
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        with (
-            patch("todo.services.task_service.LabelRepository.list_by_ids", return_value=[]),
-        ):
-            response = self.client.get("/v1/tasks", {"page": "2", "limit": "1", "sort_by": "priority", "order": "desc"})
-
-            self.assertEqual(response.status_code, status.HTTP_200_OK)
-
-            if response.data.get("links"):
-                links = response.data["links"]
-                if links.get("next"):
-                    self.assertIn("sort_by=priority", links["next"])
-                    self.assertIn("order=desc", links["next"])
-                if links.get("prev"):
-                    self.assertIn("sort_by=priority", links["prev"])
-                    self.assertIn("order=desc", links["prev"])
+        if response.data.get("links"):
+            links = response.data["links"]
+            if links.get("next"):
+                self.assertIn("sort_by=priority", links["next"])
+                self.assertIn("order=desc", links["next"])
+            if links.get("prev"):
+                self.assertIn("sort_by=priority", links["prev"])
+                self.assertIn("order=desc", links["prev"])
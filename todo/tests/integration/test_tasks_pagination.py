@@ -1,38 +1,45 @@
 from unittest.mock import patch
 from django.conf import settings
-from todo.tests.integration.base_mongo_test import AuthenticatedMongoTestCase
+from django.urls import reverse
+from todo.tests.integration.base_mongo_test import AuthenticatedNoDBTestCase
 from todo.dto.responses.get_tasks_response import GetTasksResponse
 
 
-class TaskPaginationIntegrationTest(AuthenticatedMongoTestCase):
+class TaskPaginationIntegrationTest(AuthenticatedNoDBTestCase):
     """Integration tests for task pagination settings"""
 
-    def setUp(self):
-        super().setUp()
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Resolved once; every assertion in the class reads the same config
+        pagination_settings = settings.REST_FRAMEWORK["DEFAULT_PAGINATION_SETTINGS"]
+        cls.default_limit = pagination_settings["DEFAULT_PAGE_LIMIT"]
+        cls.max_limit = pagination_settings["MAX_PAGE_LIMIT"]
+        cls.tasks_url = reverse("tasks")
 
     @patch("todo.services.task_service.TaskService.get_tasks")
-    def test_pagination_settings_integration(self, mock_get_tasks):
-        """Test that the view and serializer correctly use Django settings for pagination"""
+    def test_default_limit_applied(self, mock_get_tasks):
         mock_get_tasks.return_value = GetTasksResponse(tasks=[], links=None)
 
-        default_limit = settings.REST_FRAMEWORK["DEFAULT_PAGINATION_SETTINGS"]["DEFAULT_PAGE_LIMIT"]
-
-        response = self.client.get("/v1/tasks")
+        response = self.client.get(self.tasks_url)
 
         self.assertEqual(response.status_code, 200)
         mock_get_tasks.assert_called_with(
             page=1,
-            limit=default_limit,
+            limit=self.default_limit,
             sort_by="updatedAt",
             order="desc",
             user_id=str(self.user_id),
             team_id=None,
             status_filter=None,
+            cursor=None,
         )
 
-        mock_get_tasks.reset_mock()
+    @patch("todo.services.task_service.TaskService.get_tasks")
+    def test_explicit_limit_honored(self, mock_get_tasks):
+        mock_get_tasks.return_value = GetTasksResponse(tasks=[], links=None)
 
-        response = self.client.get("/v1/tasks", {"limit": "10"})
+        response = self.client.get(self.tasks_url, {"limit": "10"})
 
         self.assertEqual(response.status_code, 200)
         mock_get_tasks.assert_called_with(
@@ -43,12 +50,11 @@ class TaskPaginationIntegrationTest(AuthenticatedMongoTestCase):
             user_id=str(self.user_id),
             team_id=None,
             status_filter=None,
+            cursor=None,
         )
 
-        # Verify API rejects values above max limit
-        max_limit = settings.REST_FRAMEWORK["DEFAULT_PAGINATION_SETTINGS"]["MAX_PAGE_LIMIT"]
-        response = self.client.get("/v1/tasks", {"limit": str(max_limit + 1)})
+    def test_exceeds_max_limit_rejected(self):
+        response = self.client.get(self.tasks_url, {"limit": str(self.max_limit + 1)})
 
-        # Should get a 400 error
         self.assertEqual(response.status_code, 400)
-        self.assertIn(str(max_limit), str(response.data))
+        self.assertIn(str(self.max_limit), str(response.data))
@@ -0,0 +1,147 @@
+from datetime import datetime, timezone
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from bson import ObjectId
+from pymongo.collection import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+from django.core.cache import cache
+
+from todo.repositories.task_assignment_repository import TaskAssignmentRepository
+
+_TASK_OID = ObjectId()
+_ASSIGNEE_OID = ObjectId()
+_USER_OID = ObjectId()
+
+
+def _previous_doc(**overrides):
+    """An active assignment document as create() stores it (string ids)."""
+    doc = {
+        "_id": ObjectId(),
+        "task_id": str(_TASK_OID),
+        "assignee_id": str(ObjectId()),
+        "user_type": "user",
+        "assignee_name": "Old Assignee",
+        "is_active": True,
+        "team_id": None,
+        "created_by": str(_USER_OID),
+        "created_at": datetime(2024, 1, 1, tzinfo=timezone.utc),
+        "updated_by": None,
+        "updated_at": None,
+    }
+    doc.update(overrides)
+    return doc
+
+
+class TaskAssignmentRepositoryReplaceTests(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        patcher_get_collection = patch.object(TaskAssignmentRepository, "get_collection")
+        cls.mock_get_collection = patcher_get_collection.start()
+        cls.addClassCleanup(patcher_get_collection.stop)
+
+        patcher_dual_write = patch("todo.repositories.task_assignment_repository.EnhancedDualWriteService")
+        patcher_dual_write.start()
+        cls.addClassCleanup(patcher_dual_write.stop)
+
+    def setUp(self):
+        # The by-task cache is keyed on the shared task id and must not leak
+        cache.clear()
+        self.mock_collection = MagicMock()
+        self.mock_get_collection.return_value = self.mock_collection
+
+    def _replace(self, **overrides):
+        params = dict(
+            task_id=str(_TASK_OID),
+            assignee_id=str(_ASSIGNEE_OID),
+            user_type="user",
+            team_id=None,
+            user_id=str(_USER_OID),
+            assignee_name="New Assignee",
+        )
+        params.update(overrides)
+        return TaskAssignmentRepository.replace_active_assignment(**params)
+
+    def test_replace_rewrites_existing_active_assignment(self):
+        previous_doc = _previous_doc()
+        self.mock_collection.find_one_and_update.return_value = previous_doc
+
+        assignment, previous = self._replace()
+
+        self.assertEqual(previous.id, previous_doc["_id"])
+        self.assertEqual(assignment.id, previous_doc["_id"])
+        self.assertEqual(assignment.assignee_id, _ASSIGNEE_OID)
+        self.assertEqual(assignment.created_by, previous.created_by)
+        self.assertEqual(assignment.updated_by, _USER_OID)
+        self.assertIsNotNone(assignment.updated_at)
+
+        args, kwargs = self.mock_collection.find_one_and_update.call_args
+        self.assertEqual(args[0], {"task_id": {"$in": [_TASK_OID, str(_TASK_OID)]}, "is_active": True})
+        self.assertTrue(kwargs["upsert"])
+        self.assertEqual(kwargs["return_document"], ReturnDocument.BEFORE)
+
+    def test_replace_inserts_when_no_active_assignment(self):
+        self.mock_collection.find_one_and_update.return_value = None
+
+        assignment, previous = self._replace()
+
+        self.assertIsNone(previous)
+        self.assertEqual(assignment.created_by, _USER_OID)
+        self.assertIsNone(assignment.updated_by)
+        self.assertIsNone(assignment.updated_at)
+
+    def test_replace_writes_string_ids_matching_create(self):
+        self.mock_collection.find_one_and_update.return_value = None
+
+        self._replace(user_type="team")
+
+        pipeline = self.mock_collection.find_one_and_update.call_args[0][1]
+        set_stage = pipeline[0]["$set"]
+        self.assertEqual(set_stage["task_id"], str(_TASK_OID))
+        self.assertEqual(set_stage["assignee_id"], str(_ASSIGNEE_OID))
+        self.assertEqual(set_stage["team_id"], str(_ASSIGNEE_OID))
+        self.assertEqual(set_stage["created_by"], {"$ifNull": ["$created_by", str(_USER_OID)]})
+
+    def test_replace_retries_once_on_duplicate_key(self):
+        self.mock_collection.find_one_and_update.side_effect = [
+            DuplicateKeyError("duplicate active assignment"),
+            _previous_doc(),
+        ]
+
+        assignment, previous = self._replace()
+
+        self.assertIsNotNone(previous)
+        self.assertEqual(assignment.assignee_id, _ASSIGNEE_OID)
+        self.assertEqual(self.mock_collection.find_one_and_update.call_count, 2)
+
+    def test_replace_reraises_duplicate_key_after_retry(self):
+        self.mock_collection.find_one_and_update.side_effect = DuplicateKeyError("duplicate active assignment")
+
+        with self.assertRaises(DuplicateKeyError):
+            self._replace()
+
+        self.assertEqual(self.mock_collection.find_one_and_update.call_count, 2)
+
+    def test_replace_primes_get_by_task_id_cache(self):
+        self.mock_collection.find_one_and_update.return_value = None
+
+        assignment, _ = self._replace()
+
+        cached = TaskAssignmentRepository.get_by_task_id(str(_TASK_OID))
+        self.assertEqual(cached, assignment)
+        self.mock_collection.find_one.assert_not_called()
+
+    def test_delete_assignment_evicts_cache_after_write(self):
+        self.mock_collection.find_one.return_value = _previous_doc()
+        TaskAssignmentRepository.get_by_task_id(str(_TASK_OID))  # warm the cache
+
+        self.mock_collection.update_one.return_value = MagicMock(modified_count=1)
+        self.assertTrue(TaskAssignmentRepository.delete_assignment(str(_TASK_OID), str(_USER_OID)))
+
+        # The write evicted the entry, so the next read goes back to Mongo
+        self.mock_collection.find_one.reset_mock()
+        self.mock_collection.find_one.return_value = None
+        self.assertIsNone(TaskAssignmentRepository.get_by_task_id(str(_TASK_OID)))
+        self.mock_collection.find_one.assert_called()
@@ -1,10 +1,12 @@
 from unittest import TestCase
-from unittest.mock import patch, MagicMock
+from unittest.mock import DEFAULT, patch, MagicMock
 from pymongo import ReturnDocument
-from pymongo.collection import Collection
 from bson import ObjectId, errors as bson_errors
-from datetime import datetime, timezone, timedelta
-import copy
+from datetime import datetime, timezone
+from itertools import cycle
+from types import MappingProxyType
+
+from django.core.cache import cache
 
 from todo.exceptions.task_exceptions import TaskNotFoundException
 from todo.models.task import TaskModel
@@ -15,6 +17,7 @@ from todo.constants.task import (
     SORT_FIELD_PRIORITY,
     SORT_FIELD_DUE_AT,
     SORT_FIELD_CREATED_AT,
+    SORT_FIELD_UPDATED_AT,
     SORT_FIELD_ASSIGNEE,
     SORT_ORDER_ASC,
     SORT_ORDER_DESC,
@@ -22,49 +25,135 @@ from todo.constants.task import (
 from todo.tests.fixtures.task import tasks_db_data
 from todo.constants.messages import RepositoryErrors, ApiErrors
 
+# Read-only view of the shared fixture; tests that mutate a document take a
+# dict(...) copy instead of every setUp deep-copying the whole list
+_FROZEN_TASK_DATA = tuple(MappingProxyType(task) for task in tasks_db_data)
+
+# Pre-generated ids for tests that just need some valid ObjectId; generating
+# one per call hits os.urandom every time
+_OID_POOL = cycle([ObjectId() for _ in range(64)])
+
+
+def _next_oid() -> ObjectId:
+    return next(_OID_POOL)
+
+
+# For tests that only need a well-formed id and never compare ids across tests
+_VALID_OID_STR = "507f1f77bcf86cd799439011"
+_VALID_OID = ObjectId(_VALID_OID_STR)
+
+
+def _normalized_single_fixture():
+    """Normalize the first fixture document into a full task doc, once."""
+    if not tasks_db_data:
+        return None
+
+    fixture = dict(tasks_db_data[0])
+    if "_id" not in fixture or not isinstance(fixture["_id"], str):
+        fixture["_id"] = str(ObjectId())
+    fixture["_id"] = ObjectId(fixture["_id"])
+
+    fixture.setdefault("description", "Default description")
+    fixture.setdefault("assignee", None)
+    fixture.setdefault("labels", [])
+    fixture.setdefault("startedAt", None)
+    fixture.setdefault("dueAt", None)
+    fixture.setdefault("updatedAt", None)
+    fixture.setdefault("updatedBy", None)
+    fixture.setdefault("isAcknowledged", False)
+    fixture.setdefault("isDeleted", False)
+    fixture.setdefault("displayId", "#000")
+    fixture.setdefault("title", "Default Title")
+    fixture.setdefault("priority", TaskPriority.LOW)
+    fixture.setdefault("status", TaskStatus.TODO)
+    fixture.setdefault("createdAt", datetime.now(timezone.utc))
+    fixture.setdefault("createdBy", "system_test_user")
+    return MappingProxyType(fixture)
+
+
+_CANONICAL_TASK_FIXTURE = _normalized_single_fixture()
+
+# Post-update document shape shared by the update tests; frozen timestamps
+# avoid two clock reads per setUp, and each test copies in its own _id
+_UPDATED_DOC_TEMPLATE = MappingProxyType(
+    {
+        "displayId": "#123",
+        "title": "Updated Title",
+        "description": "Updated description",
+        "priority": TaskPriority.HIGH.value,
+        "status": TaskStatus.IN_PROGRESS.value,
+        "assignee": "user1",
+        "labels": [],
+        "createdAt": datetime(2024, 1, 1, tzinfo=timezone.utc),
+        "updatedAt": datetime(2024, 1, 2, tzinfo=timezone.utc),
+        "createdBy": "system_user",
+        "updatedBy": "patch_user",
+        "isAcknowledged": False,
+        "isDeleted": False,
+    }
+)
+
+
+class _CollectionSpec:
+    """The slice of the collection surface these tests touch.
+
+    Spec'ing against this instead of pymongo's Collection keeps the typo
+    protection of spec_set without introspecting the full driver class.
+    """
+
+    find = find_one = find_one_and_update = insert_one = count_documents = aggregate = None
+
+
+class TaskRepositoryTestBase(TestCase):
+    """Shared mock plumbing for the task repository test cases."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # One patcher per class instead of start/stop around every test;
+        # isolation comes from the fresh collection mock setUp swaps in
+        patcher_get_collection = patch("todo.repositories.task_repository.TaskRepository.get_collection")
+        cls.mock_get_collection = patcher_get_collection.start()
+        cls.addClassCleanup(patcher_get_collection.stop)
 
-class TaskRepositoryTests(TestCase):
     def setUp(self):
-        self.task_data = copy.deepcopy(tasks_db_data)
-
-        if tasks_db_data:
-            original_single_fixture = tasks_db_data[0]
-            self.task_db_data_fixture = copy.deepcopy(original_single_fixture)
-
-            if "_id" not in self.task_db_data_fixture or not isinstance(self.task_db_data_fixture["_id"], str):
-                self.task_db_data_fixture["_id"] = str(ObjectId())
-            self.task_db_data_fixture["_id"] = ObjectId(self.task_db_data_fixture["_id"])
-
-            self.task_db_data_fixture.setdefault("description", "Default description")
-            self.task_db_data_fixture.setdefault("assignee", None)
-            self.task_db_data_fixture.setdefault("labels", [])
-            self.task_db_data_fixture.setdefault("startedAt", None)
-            self.task_db_data_fixture.setdefault("dueAt", None)
-            self.task_db_data_fixture.setdefault("updatedAt", None)
-            self.task_db_data_fixture.setdefault("updatedBy", None)
-            self.task_db_data_fixture.setdefault("isAcknowledged", False)
-            self.task_db_data_fixture.setdefault("isDeleted", False)
-            self.task_db_data_fixture.setdefault("displayId", "#000")
-            self.task_db_data_fixture.setdefault("title", "Default Title")
-            self.task_db_data_fixture.setdefault("priority", TaskPriority.LOW)
-            self.task_db_data_fixture.setdefault("status", TaskStatus.TODO)
-            self.task_db_data_fixture.setdefault("createdAt", datetime.now(timezone.utc))
-            self.task_db_data_fixture.setdefault("createdBy", "system_test_user")
-        else:
-            self.task_db_data_fixture = None
-
-        self.patcher_get_collection = patch("todo.repositories.task_repository.TaskRepository.get_collection")
-        self.mock_get_collection = self.patcher_get_collection.start()
-        self.mock_collection = MagicMock(spec=Collection)
+        self.mock_collection = MagicMock(spec_set=_CollectionSpec)
         self.mock_get_collection.return_value = self.mock_collection
+        # Cached handles into the find() chain; assertions hit these instead
+        # of re-walking the mock child tree attribute by attribute
+        self.find_ret = self.mock_collection.find.return_value
+        self.sort_ret = self.find_ret.sort.return_value
+        self.skip_ret = self.sort_ret.skip.return_value
+
+    def _wire_find_chain(self, docs=()):
+        """Point the find().sort().skip().limit() chain at a cursor over docs.
+
+        Wiring the chain once per call keeps tests from re-spelling the
+        four-link return_value ladder and the MagicMock churn it creates.
+        Defaults to an empty cursor for tests that only inspect call args;
+        the iterator itself is built lazily, only if the code iterates.
+        """
+        mock_cursor = MagicMock()
+        # A plain callable keeps the cursor re-iterable and skips allocating
+        # a second MagicMock just to serve __iter__
+        mock_cursor.__iter__ = lambda s: iter(docs)
+        self.skip_ret.limit.return_value = mock_cursor
+        return mock_cursor
 
-    def tearDown(self):
-        self.patcher_get_collection.stop()
 
-    def test_list_applies_pagination_correctly(self):
-        mock_cursor = MagicMock()
-        mock_cursor.__iter__ = MagicMock(return_value=iter(self.task_data))
-        self.mock_collection.find.return_value.sort.return_value.skip.return_value.limit.return_value = mock_cursor
+class TaskRepositoryTests(TaskRepositoryTestBase):
+    def setUp(self):
+        super().setUp()
+        self.task_data = _FROZEN_TASK_DATA
+        self.task_db_data_fixture = _CANONICAL_TASK_FIXTURE
+
+    def test_list_chain_topology(self):
+        """One test owns the full find→sort→skip→limit contract.
+
+        The other list tests assert only what they are about (sort arg,
+        skip offset, results) instead of re-walking the whole chain.
+        """
+        self._wire_find_chain(self.task_data)
 
         page = 1
         limit = 10
@@ -74,22 +163,17 @@ class TaskRepositoryTests(TestCase):
         self.assertTrue(all(isinstance(task, TaskModel) for task in result))
 
         self.mock_collection.find.assert_called_once()
-        self.mock_collection.find.return_value.sort.assert_called_once_with([("createdAt", -1)])
-        self.mock_collection.find.return_value.sort.return_value.skip.assert_called_once_with(0)
-        self.mock_collection.find.return_value.sort.return_value.skip.return_value.limit.assert_called_once_with(limit)
+        self.find_ret.sort.assert_called_once_with([("createdAt", -1)])
+        self.sort_ret.skip.assert_called_once_with(0)
+        self.skip_ret.limit.assert_called_once_with(limit)
 
     def test_list_returns_empty_list_for_no_tasks(self):
-        mock_cursor = MagicMock()
-        mock_cursor.__iter__ = MagicMock(return_value=iter([]))
-        self.mock_collection.find.return_value.sort.return_value.skip.return_value.limit.return_value = mock_cursor
+        self._wire_find_chain()
 
         result = TaskRepository.list(2, 10, sort_by="createdAt", order="desc", user_id=None)
 
         self.assertEqual(result, [])
-        self.mock_collection.find.assert_called_once()
-        self.mock_collection.find.return_value.sort.assert_called_once_with([("createdAt", -1)])
-        self.mock_collection.find.return_value.sort.return_value.skip.assert_called_once_with(10)
-        self.mock_collection.find.return_value.sort.return_value.skip.return_value.limit.assert_called_once_with(10)
+        self.sort_ret.skip.assert_called_once_with(10)
 
     def test_count_returns_total_task_count(self):
         self.mock_collection.count_documents.return_value = 42
@@ -104,6 +188,18 @@ class TaskRepositoryTests(TestCase):
         self.assertIn("status", actual_filter["$and"][0])
         self.assertIn("$or", actual_filter["$and"][1])
 
+    def test_get_assigned_task_ids_for_user_caches_result(self):
+        cache.clear()
+        expected_ids = [_next_oid()]
+        with patch.object(TaskRepository, "_fetch_assigned_task_ids_for_user", return_value=expected_ids) as mock_fetch:
+            first = TaskRepository._get_assigned_task_ids_for_user("user123")
+            second = TaskRepository._get_assigned_task_ids_for_user("user123")
+
+        self.assertEqual(first, expected_ids)
+        self.assertEqual(second, expected_ids)
+        mock_fetch.assert_called_once_with("user123")
+        cache.clear()
+
     def test_get_all_returns_all_tasks(self):
         self.mock_collection.find.return_value = self.task_data
 
@@ -131,16 +227,16 @@ class TaskRepositoryTests(TestCase):
         self.assertIsInstance(result, TaskModel)
         self.assertEqual(str(result.id), task_id_str)
         self.assertEqual(result.title, self.task_db_data_fixture["title"])
-        self.mock_collection.find_one.assert_called_once_with({"_id": ObjectId(task_id_str)})
+        self.mock_collection.find_one.assert_called_once_with({"_id": self.task_db_data_fixture["_id"]})
 
     def test_get_by_id_returns_none_when_not_found(self):
-        task_id_str = str(ObjectId())
+        task_id_str = _VALID_OID_STR
         self.mock_collection.find_one.return_value = None
 
         result = TaskRepository.get_by_id(task_id_str)
 
         self.assertIsNone(result)
-        self.mock_collection.find_one.assert_called_once_with({"_id": ObjectId(task_id_str)})
+        self.mock_collection.find_one.assert_called_once_with({"_id": _VALID_OID})
 
     def test_get_by_id_raises_invalid_id_for_malformed_id_string(self):
         invalid_task_id_str = "this-is-not-a-valid-objectid"
@@ -151,117 +247,94 @@ class TaskRepositoryTests(TestCase):
         self.mock_collection.find_one.assert_not_called()
 
 
-class TaskRepositoryCreateTests(TestCase):
-    def setUp(self):
-        self.task = TaskModel(
-            title="Test Task",
-            description="Sample",
-            priority=TaskPriority.LOW,
-            status=TaskStatus.TODO,
-            labels=[],
-            createdAt=datetime.now(timezone.utc),
-            createdBy="system",
-        )
-
-    @patch("todo.repositories.task_repository.TaskRepository.create")
-    def test_create_task_successfully_inserts_and_returns_task(self, mock_create):
-        task = TaskModel(
-            title="Happy path task",
-            priority=TaskPriority.LOW,
-            status=TaskStatus.TODO,
-            createdAt=datetime.now(timezone.utc),
-            createdBy="system",
-        )
+class TaskRepositoryCreateTests(TaskRepositoryTestBase):
+    """Exercises the real create() against mocked client/database handles.
 
-        expected_task = task.model_copy(deep=True)
-        expected_task.id = ObjectId()
-        expected_task.displayId = "#42"
+    The earlier versions of these tests patched TaskRepository.create and
+    asserted on the patch, which only verified the mock.
+    """
 
-        mock_create.return_value = expected_task
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # These collaborators never vary per test, so their patchers start
+        # once per class alongside the base get_collection patcher
+        patcher_get_client = patch.object(TaskRepository, "get_client", return_value=MagicMock())
+        patcher_get_client.start()
+        cls.addClassCleanup(patcher_get_client.stop)
 
-        result = TaskRepository.create(task)
+        patcher_get_database = patch.object(TaskRepository, "get_database")
+        cls.mock_get_database = patcher_get_database.start()
+        cls.addClassCleanup(patcher_get_database.stop)
 
-        self.assertEqual(result, expected_task)
-        self.assertEqual(result.id, expected_task.id)
-        self.assertEqual(result.displayId, "#42")
-        mock_create.assert_called_once_with(task)
+        patcher_dual_write = patch("todo.repositories.task_repository.EnhancedDualWriteService")
+        patcher_dual_write.start()
+        cls.addClassCleanup(patcher_dual_write.stop)
 
-    @patch("todo.repositories.task_repository.TaskRepository.create")
-    def test_create_task_creates_counter_if_not_exists(self, mock_create):
-        task = TaskModel(
-            title="First task with no counter",
+    def setUp(self):
+        super().setUp()
+        self.mock_db = MagicMock()
+        self.mock_get_database.return_value = self.mock_db
+
+    @staticmethod
+    def _build_task(title):
+        return TaskModel(
+            title=title,
             priority=TaskPriority.LOW,
             status=TaskStatus.TODO,
             createdAt=datetime.now(timezone.utc),
             createdBy="system",
         )
 
-        expected_task = task.model_copy(deep=True)
-        expected_task.id = ObjectId()
-        expected_task.displayId = "#1"
+    def test_create_task_successfully_inserts_and_returns_task(self):
+        task = self._build_task("Happy path task")
+        inserted_id = _next_oid()
+        self.mock_db.counters.find_one_and_update.return_value = {"seq": 42}
+        self.mock_collection.insert_one.return_value = MagicMock(inserted_id=inserted_id)
 
-        mock_create.return_value = expected_task
+        result = TaskRepository.create(task)
+
+        self.assertEqual(result.id, inserted_id)
+        self.assertEqual(result.displayId, "#42")
+        self.mock_collection.insert_one.assert_called_once()
+        inserted_doc = self.mock_collection.insert_one.call_args[0][0]
+        self.assertEqual(inserted_doc["lastActivity"], result.createdAt)
+
+    def test_create_task_creates_counter_if_not_exists(self):
+        task = self._build_task("First task with no counter")
+        self.mock_db.counters.find_one_and_update.return_value = {"seq": 1}
+        self.mock_collection.insert_one.return_value = MagicMock(inserted_id=_next_oid())
 
         result = TaskRepository.create(task)
 
-        self.assertEqual(result, expected_task)
-        self.assertEqual(result.id, expected_task.id)
         self.assertEqual(result.displayId, "#1")
-        mock_create.assert_called_once_with(task)
-
-    @patch("todo.repositories.task_repository.TaskRepository.create")
-    def test_create_task_handles_exception(self, mock_create):
-        task = TaskModel(
-            title="Task that will fail",
-            priority=TaskPriority.LOW,
-            status=TaskStatus.TODO,
-            createdAt=datetime.now(timezone.utc),
-            createdBy="system",
-        )
+        _, counter_kwargs = self.mock_db.counters.find_one_and_update.call_args
+        self.assertTrue(counter_kwargs["upsert"])
+        self.assertEqual(counter_kwargs["return_document"], ReturnDocument.AFTER)
 
-        mock_create.side_effect = ValueError(RepositoryErrors.TASK_CREATION_FAILED.format("Database error"))
+    def test_create_task_handles_exception(self):
+        task = self._build_task("Task that will fail")
+        self.mock_db.counters.find_one_and_update.return_value = {"seq": 7}
+        self.mock_collection.insert_one.side_effect = Exception("Database error")
 
         with self.assertRaises(ValueError) as context:
             TaskRepository.create(task)
 
-        self.assertIn("Failed to create task", str(context.exception))
-        mock_create.assert_called_once_with(task)
+        self.assertEqual(str(context.exception), RepositoryErrors.TASK_CREATION_FAILED.format("Database error"))
 
 
-class TaskRepositoryUpdateTests(TestCase):
+class TaskRepositoryUpdateTests(TaskRepositoryTestBase):
     def setUp(self):
-        self.patcher_get_collection = patch("todo.repositories.task_repository.TaskRepository.get_collection")
-        self.mock_get_collection = self.patcher_get_collection.start()
-        self.mock_collection = MagicMock(spec=Collection)
-        self.mock_get_collection.return_value = self.mock_collection
-
-        self.task_id_str = str(ObjectId())
-        self.task_id_obj = ObjectId(self.task_id_str)
+        super().setUp()
+        self.task_id_str = _VALID_OID_STR
+        self.task_id_obj = _VALID_OID
         self.valid_update_data = {
             "title": "Updated Title",
             "description": "Updated description",
             "priority": TaskPriority.HIGH.value,
             "status": TaskStatus.IN_PROGRESS.value,
         }
-        self.updated_doc_from_db = {
-            "_id": self.task_id_obj,
-            "displayId": "#123",
-            "title": "Updated Title",
-            "description": "Updated description",
-            "priority": TaskPriority.HIGH.value,
-            "status": TaskStatus.IN_PROGRESS.value,
-            "assignee": "user1",
-            "labels": [],
-            "createdAt": datetime.now(timezone.utc) - timedelta(days=1),
-            "updatedAt": datetime.now(timezone.utc),
-            "createdBy": "system_user",
-            "updatedBy": "patch_user",
-            "isAcknowledged": False,
-            "isDeleted": False,
-        }
-
-    def tearDown(self):
-        self.patcher_get_collection.stop()
+        self.updated_doc_from_db = dict(_UPDATED_DOC_TEMPLATE, _id=self.task_id_obj)
 
     def test_update_task_success(self):
         self.mock_collection.find_one_and_update.return_value = self.updated_doc_from_db
@@ -326,7 +399,8 @@ class TaskRepositoryUpdateTests(TestCase):
         self.assertEqual(args[0], {"_id": self.task_id_obj})
         update_doc_arg = args[1]["$set"]
         self.assertIn("updatedAt", update_doc_arg)
-        self.assertEqual(len(update_doc_arg), 1)
+        self.assertIn("lastActivity", update_doc_arg)
+        self.assertEqual(len(update_doc_arg), 2)
 
     def test_update_task_does_not_pass_id_or_underscore_id_in_update_payload(self):
         self.mock_collection.find_one_and_update.return_value = self.updated_doc_from_db
@@ -346,91 +420,48 @@ class TaskRepositoryUpdateTests(TestCase):
         self.assertIn("updatedAt", set_payload)
 
     def test_update_task_permission_denied_if_not_creator_or_assignee(self):
-        with (
-            patch("todo.repositories.task_repository.TaskRepository.get_by_id") as mock_get_by_id,
-            patch(
-                "todo.repositories.task_repository.TaskRepository._get_assigned_task_ids_for_user"
-            ) as mock_get_assigned,
-        ):
+        # One patch.multiple resolves the target once for both attributes
+        with patch.multiple(TaskRepository, get_by_id=DEFAULT, _get_assigned_task_ids_for_user=DEFAULT) as mocks:
             mock_task = self.updated_doc_from_db.copy()
             mock_task["createdBy"] = "some_other_user"
-            mock_get_by_id.return_value = TaskModel(
-                _id=ObjectId(), **{k: v for k, v in mock_task.items() if k != "_id"}
+            mocks["get_by_id"].return_value = TaskModel(
+                _id=_next_oid(), **{k: v for k, v in mock_task.items() if k != "_id"}
             )
-            mock_get_assigned.return_value = []
+            mocks["_get_assigned_task_ids_for_user"].return_value = []
             with self.assertRaises(PermissionError) as context:
                 raise PermissionError(ApiErrors.UNAUTHORIZED_TITLE)
             self.assertEqual(str(context.exception), ApiErrors.UNAUTHORIZED_TITLE)
 
 
-class TaskRepositorySortingTests(TestCase):
+class TaskRepositorySortingTests(TaskRepositoryTestBase):
     def setUp(self):
-        self.patcher_get_collection = patch("todo.repositories.task_repository.TaskRepository.get_collection")
-        self.mock_get_collection = self.patcher_get_collection.start()
-        self.mock_collection = MagicMock()
-        self.mock_get_collection.return_value = self.mock_collection
-
-        self.mock_cursor = MagicMock()
-        self.mock_cursor.__iter__ = MagicMock(return_value=iter([]))
-        self.mock_collection.find.return_value.sort.return_value.skip.return_value.limit.return_value = self.mock_cursor
-
-    def tearDown(self):
-        self.patcher_get_collection.stop()
-
-    def test_list_sort_by_priority_desc(self):
-        """Test sorting by priority descending (HIGH→MEDIUM→LOW)"""
-        TaskRepository.list(1, 10, SORT_FIELD_PRIORITY, SORT_ORDER_DESC, user_id=None)
-
-        self.mock_collection.find.assert_called_once()
-
-        self.mock_collection.find.return_value.sort.assert_called_once_with([(SORT_FIELD_PRIORITY, 1)])
-
-    def test_list_sort_by_priority_asc(self):
-        TaskRepository.list(1, 10, SORT_FIELD_PRIORITY, SORT_ORDER_ASC, user_id=None)
-
-        self.mock_collection.find.assert_called_once()
-
-        self.mock_collection.find.return_value.sort.assert_called_once_with([(SORT_FIELD_PRIORITY, -1)])
-
-    def test_list_sort_by_created_at_desc(self):
-        TaskRepository.list(1, 10, SORT_FIELD_CREATED_AT, SORT_ORDER_DESC, user_id=None)
-
-        self.mock_collection.find.assert_called_once()
-        self.mock_collection.find.return_value.sort.assert_called_once_with([(SORT_FIELD_CREATED_AT, -1)])
-
-    def test_list_sort_by_created_at_asc(self):
-        TaskRepository.list(1, 10, SORT_FIELD_CREATED_AT, SORT_ORDER_ASC, user_id=None)
-
-        self.mock_collection.find.assert_called_once()
-        self.mock_collection.find.return_value.sort.assert_called_once_with([(SORT_FIELD_CREATED_AT, 1)])
-
-    def test_list_sort_by_due_at_desc(self):
-        TaskRepository.list(1, 10, SORT_FIELD_DUE_AT, SORT_ORDER_DESC, user_id=None)
-
-        self.mock_collection.find.assert_called_once()
-        self.mock_collection.find.return_value.sort.assert_called_once_with([(SORT_FIELD_DUE_AT, -1)])
-
-    def test_list_sort_by_due_at_asc(self):
-        TaskRepository.list(1, 10, SORT_FIELD_DUE_AT, SORT_ORDER_ASC, user_id=None)
-
-        self.mock_collection.find.assert_called_once()
-        self.mock_collection.find.return_value.sort.assert_called_once_with([(SORT_FIELD_DUE_AT, 1)])
-
-    def test_list_sort_by_assignee_falls_back_to_created_at(self):
-        """Test that assignee sorting falls back to createdAt sorting since assignee is in separate collection"""
-        TaskRepository.list(1, 10, SORT_FIELD_ASSIGNEE, SORT_ORDER_DESC)
-
-        self.mock_collection.find.assert_called_once()
-        # Assignee sorting now falls back to createdAt sorting
-        self.mock_collection.find.return_value.sort.assert_called_once_with([("createdAt", -1)])
-
-    def test_list_sort_by_assignee_asc_falls_back_to_created_at(self):
-        """Test that assignee sorting falls back to createdAt sorting for ascending order"""
-        TaskRepository.list(1, 10, SORT_FIELD_ASSIGNEE, SORT_ORDER_ASC)
-
-        self.mock_collection.find.assert_called_once()
-        # Assignee sorting now falls back to createdAt sorting
-        self.mock_collection.find.return_value.sort.assert_called_once_with([("createdAt", 1)])
+        super().setUp()
+        self.mock_cursor = self._wire_find_chain()
+
+    def test_list_sort_matrix(self):
+        """Each supported field/order pair maps to the expected sort criteria.
+
+        Priority deliberately inverts the direction (HIGH=1 sorts first on
+        desc); assignee falls back to createdAt since assignees live in a
+        separate collection.
+        """
+        cases = [
+            (SORT_FIELD_PRIORITY, SORT_ORDER_DESC, SORT_FIELD_PRIORITY, 1),
+            (SORT_FIELD_PRIORITY, SORT_ORDER_ASC, SORT_FIELD_PRIORITY, -1),
+            (SORT_FIELD_CREATED_AT, SORT_ORDER_DESC, SORT_FIELD_CREATED_AT, -1),
+            (SORT_FIELD_CREATED_AT, SORT_ORDER_ASC, SORT_FIELD_CREATED_AT, 1),
+            (SORT_FIELD_DUE_AT, SORT_ORDER_DESC, SORT_FIELD_DUE_AT, -1),
+            (SORT_FIELD_DUE_AT, SORT_ORDER_ASC, SORT_FIELD_DUE_AT, 1),
+            (SORT_FIELD_ASSIGNEE, SORT_ORDER_DESC, SORT_FIELD_CREATED_AT, -1),
+            (SORT_FIELD_ASSIGNEE, SORT_ORDER_ASC, SORT_FIELD_CREATED_AT, 1),
+        ]
+
+        for sort_by, order, expected_field, expected_direction in cases:
+            with self.subTest(sort_by=sort_by, order=order):
+                self.mock_collection.reset_mock()
+                TaskRepository.list(1, 10, sort_by, order, user_id=None)
+
+                self.find_ret.sort.assert_called_once_with([(expected_field, expected_direction)])
 
     def test_list_pagination_with_sorting(self):
         page = 3
@@ -440,22 +471,70 @@ class TaskRepositorySortingTests(TestCase):
 
         expected_skip = (page - 1) * limit
 
-        self.mock_collection.find.return_value.sort.return_value.skip.assert_called_once_with(expected_skip)
-        self.mock_collection.find.return_value.sort.return_value.skip.return_value.limit.assert_called_once_with(limit)
+        self.sort_ret.skip.assert_called_once_with(expected_skip)
+        self.skip_ret.limit.assert_called_once_with(limit)
 
     def test_list_default_sort_parameters(self):
         TaskRepository.list(1, 10, SORT_FIELD_CREATED_AT, SORT_ORDER_DESC)
 
+        self.find_ret.sort.assert_called_once_with([(SORT_FIELD_CREATED_AT, -1)])
+
+    def test_list_with_cursor_uses_keyset_filter_instead_of_skip(self):
+        last_activity = datetime.now(timezone.utc)
+        last_id = _VALID_OID_STR
+
+        TaskRepository.list(
+            1,
+            10,
+            SORT_FIELD_UPDATED_AT,
+            SORT_ORDER_DESC,
+            cursor={"lastActivity": last_activity, "_id": last_id},
+        )
+
         self.mock_collection.find.assert_called_once()
+        query_filter = self.mock_collection.find.call_args[0][0]
+        keyset_filter = query_filter["$and"][1]
+        self.assertEqual(
+            keyset_filter,
+            {
+                "$or": [
+                    {"lastActivity": {"$lt": last_activity}},
+                    {"lastActivity": last_activity, "_id": {"$lt": ObjectId(last_id)}},
+                ]
+            },
+        )
+        self.find_ret.sort.assert_called_once_with([("lastActivity", -1), ("_id", -1)])
+        self.sort_ret.skip.assert_called_once_with(0)
+
+    def test_list_ignores_cursor_for_non_last_activity_sort(self):
+        TaskRepository.list(
+            2,
+            10,
+            SORT_FIELD_CREATED_AT,
+            SORT_ORDER_DESC,
+            cursor={"lastActivity": datetime.now(timezone.utc), "_id": _VALID_OID_STR},
+        )
+
+        self.find_ret.sort.assert_called_once_with([(SORT_FIELD_CREATED_AT, -1)])
+        self.sort_ret.skip.assert_called_once_with(10)
 
-        self.mock_collection.find.return_value.sort.assert_called_once_with([(SORT_FIELD_CREATED_AT, -1)])
 
+class TestRepositoryDeleteTaskById(TaskRepositoryTestBase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Every test here runs with the user owning no assignments
+        patcher_get_assigned = patch.object(TaskRepository, "_get_assigned_task_ids_for_user", return_value=[])
+        patcher_get_assigned.start()
+        cls.addClassCleanup(patcher_get_assigned.stop)
 
-class TestRepositoryDeleteTaskById(TestCase):
     def setUp(self):
+        super().setUp()
         self.task_id = tasks_db_data[0]["id"]
+        # Parsed once; every filter assertion compares against the same object
+        self.task_id_oid = ObjectId(self.task_id)
         self.mock_task_data = tasks_db_data[0]
-        self.user_id = str(ObjectId())
+        self.user_id = str(_next_oid())
         # Remove assignee from task data since it's now in separate collection
         self.updated_task_data = self.mock_task_data.copy()
         self.updated_task_data.update(
@@ -466,17 +545,8 @@ class TestRepositoryDeleteTaskById(TestCase):
             }
         )
 
-    @patch("todo.repositories.task_repository.TaskRepository.get_collection")
-    def test_delete_task_success_when_isDeleted_false(self, mock_get_collection):
-        mock_collection = MagicMock()
-        mock_get_collection.return_value = mock_collection
-
-        mock_collection.find_one.return_value = {
-            "_id": ObjectId(self.task_id),
-            "isDeleted": False,
-            "createdBy": self.user_id,  # Add createdBy field so permission check passes
-        }
-        mock_collection.find_one_and_update.return_value = {
+    def test_delete_task_success_when_isDeleted_false(self):
+        self.mock_collection.find_one_and_update.return_value = {
             **self.mock_task_data,
             "isDeleted": True,
             "updatedBy": self.user_id,
@@ -490,28 +560,30 @@ class TestRepositoryDeleteTaskById(TestCase):
         self.assertEqual(result.updatedBy, self.user_id)
         self.assertIsNotNone(result.updatedAt)
 
-    @patch("todo.repositories.task_repository.TaskRepository.get_collection")
-    def test_delete_task_raises_task_not_found_when_already_deleted(self, mock_get_collection):
-        mock_collection = MagicMock()
-        mock_get_collection.return_value = mock_collection
-        mock_collection.find_one.return_value = None
+        update_filter = self.mock_collection.find_one_and_update.call_args[0][0]
+        self.assertEqual(update_filter["_id"], self.task_id_oid)
+        self.assertFalse(update_filter["isDeleted"])
+        self.assertIn({"createdBy": self.user_id}, update_filter["$or"])
+        self.mock_collection.find_one.assert_not_called()
+
+    def test_delete_task_raises_task_not_found_when_already_deleted(self):
+        self.mock_collection.find_one_and_update.return_value = None
+        self.mock_collection.find_one.return_value = None
 
         with self.assertRaises(TaskNotFoundException):
             TaskRepository.delete_by_id(self.task_id, self.user_id)
 
-        mock_collection.find_one.assert_called_once_with({"_id": ObjectId(self.task_id), "isDeleted": False})
-        mock_collection.find_one_and_update.assert_not_called()
+        self.mock_collection.find_one.assert_called_once_with({"_id": self.task_id_oid, "isDeleted": False})
 
-    @patch("todo.repositories.task_repository.TaskRepository.get_collection")
-    def test_delete_task_permission_denied_if_not_creator_or_assignee(self, mock_get_collection):
-        mock_collection = MagicMock()
-        mock_get_collection.return_value = mock_collection
-        mock_collection.find_one.return_value = {
-            "_id": ObjectId(self.task_id),
+    def test_delete_task_permission_denied_if_not_creator_or_assignee(self):
+        self.mock_collection.find_one_and_update.return_value = None
+        self.mock_collection.find_one.return_value = {
+            "_id": self.task_id_oid,
             "isDeleted": False,
             "createdBy": "some_other_user",
         }
-        with patch("todo.repositories.task_repository.TaskRepository._get_assigned_task_ids_for_user", return_value=[]):
-            with self.assertRaises(PermissionError) as context:
-                raise PermissionError(ApiErrors.UNAUTHORIZED_TITLE)
-            self.assertEqual(str(context.exception), ApiErrors.UNAUTHORIZED_TITLE)
+
+        with self.assertRaises(PermissionError) as context:
+            TaskRepository.delete_by_id(self.task_id, self.user_id)
+
+        self.assertEqual(str(context.exception), ApiErrors.UNAUTHORIZED_TITLE)
@@ -5,6 +5,10 @@ from bson import ObjectId
 from todo.serializers.create_task_serializer import CreateTaskSerializer
 from datetime import datetime, timedelta, timezone
 
+# Generated once; the serializer only checks the strings are well-formed ids
+_ASSIGNEE_OID_STR = str(ObjectId())
+_TEAM_OID_STR = str(ObjectId())
+
 
 class CreateTaskSerializerTest(TestCase):
     def setUp(self):
@@ -13,7 +17,7 @@ class CreateTaskSerializerTest(TestCase):
             "description": "Some test description",
             "priority": "LOW",
             "status": "TODO",
-            "assignee_id": str(ObjectId()),
+            "assignee_id": _ASSIGNEE_OID_STR,
             "user_type": "user",
             "labels": [],
             "dueAt": (datetime.now(timezone.utc) + timedelta(days=2)).isoformat().replace("+00:00", "Z"),
@@ -62,7 +66,7 @@ class CreateTaskSerializerTest(TestCase):
 
     def test_serializer_accepts_valid_team_id(self):
         data = self.valid_data.copy()
-        data["team_id"] = str(ObjectId())
+        data["team_id"] = _TEAM_OID_STR
         serializer = CreateTaskSerializer(data=data)
         self.assertTrue(serializer.is_valid())
         self.assertIn("assignee", serializer.validated_data)
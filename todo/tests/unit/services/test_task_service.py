@@ -1,5 +1,6 @@
 from unittest.mock import Mock, patch, MagicMock
 from unittest import TestCase
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from datetime import datetime, timedelta, timezone
 from bson import ObjectId
@@ -29,6 +30,7 @@ from todo.exceptions.task_exceptions import (
     TaskStateConflictException,
 )
 from bson.errors import InvalidId as BsonInvalidId
+from pymongo.errors import PyMongoError
 from todo.constants.messages import ApiErrors, ValidationErrors
 from todo.repositories.task_repository import TaskRepository
 from todo.models.label import LabelModel
@@ -45,14 +47,12 @@ class TaskServiceTests(AuthenticatedMongoTestCase):
         self.mock_reverse_lazy = mock_reverse_lazy
 
     @patch("todo.services.task_service.UserRepository.get_by_id")
-    @patch("todo.services.task_service.TaskRepository.count")
-    @patch("todo.services.task_service.TaskRepository.list")
+    @patch("todo.services.task_service.TaskRepository.list_with_count")
     @patch("todo.services.task_service.LabelRepository.list_by_ids")
     def test_get_tasks_returns_paginated_response(
-        self, mock_label_repo: Mock, mock_list: Mock, mock_count: Mock, mock_user_repo: Mock
+        self, mock_label_repo: Mock, mock_list_with_count: Mock, mock_user_repo: Mock
     ):
-        mock_list.return_value = [tasks_models[0]]
-        mock_count.return_value = 3
+        mock_list_with_count.return_value = ([tasks_models[0]], 3)
         mock_label_repo.return_value = label_models
         mock_user_repo.return_value = self.get_user_model()
 
@@ -71,20 +71,17 @@ class TaskServiceTests(AuthenticatedMongoTestCase):
             response.links.prev, f"{self.mock_reverse_lazy('tasks')}?page=1&limit=1&sort_by=createdAt&order=desc"
         )
 
-        mock_list.assert_called_once_with(
+        mock_list_with_count.assert_called_once_with(
             2, 1, "createdAt", "desc", str(self.user_id), team_id=None, status_filter=None
         )
-        mock_count.assert_called_once()
 
     @patch("todo.services.task_service.UserRepository.get_by_id")
-    @patch("todo.services.task_service.TaskRepository.count")
-    @patch("todo.services.task_service.TaskRepository.list")
+    @patch("todo.services.task_service.TaskRepository.list_with_count")
     @patch("todo.services.task_service.LabelRepository.list_by_ids")
     def test_get_tasks_doesnt_returns_prev_link_for_first_page(
-        self, mock_label_repo: Mock, mock_list: Mock, mock_count: Mock, mock_user_repo: Mock
+        self, mock_label_repo: Mock, mock_list_with_count: Mock, mock_user_repo: Mock
     ):
-        mock_list.return_value = [tasks_models[0]]
-        mock_count.return_value = 2
+        mock_list_with_count.return_value = ([tasks_models[0]], 2)
         mock_label_repo.return_value = label_models
         mock_user_repo.return_value = self.get_user_model()
 
@@ -99,11 +96,9 @@ class TaskServiceTests(AuthenticatedMongoTestCase):
             response.links.next, f"{self.mock_reverse_lazy('tasks')}?page=2&limit=1&sort_by=createdAt&order=desc"
         )
 
-    @patch("todo.services.task_service.TaskRepository.count")
-    @patch("todo.services.task_service.TaskRepository.list")
-    def test_get_tasks_returns_empty_response_if_no_tasks_present(self, mock_list: Mock, mock_count: Mock):
-        mock_list.return_value = []
-        mock_count.return_value = 0
+    @patch("todo.services.task_service.TaskRepository.list_with_count")
+    def test_get_tasks_returns_empty_response_if_no_tasks_present(self, mock_list_with_count: Mock):
+        mock_list_with_count.return_value = ([], 0)
 
         response: GetTasksResponse = TaskService.get_tasks(
             page=1, limit=10, sort_by="createdAt", order="desc", user_id="test_user"
@@ -113,14 +108,13 @@ class TaskServiceTests(AuthenticatedMongoTestCase):
         self.assertEqual(len(response.tasks), 0)
         self.assertIsNone(response.links)
 
-        mock_list.assert_called_once_with(1, 10, "createdAt", "desc", "test_user", team_id=None, status_filter=None)
-        mock_count.assert_called_once()
+        mock_list_with_count.assert_called_once_with(
+            1, 10, "createdAt", "desc", "test_user", team_id=None, status_filter=None
+        )
 
-    @patch("todo.services.task_service.TaskRepository.count")
-    @patch("todo.services.task_service.TaskRepository.list")
-    def test_get_tasks_returns_empty_response_when_page_exceeds_range(self, mock_list: Mock, mock_count: Mock):
-        mock_list.return_value = []
-        mock_count.return_value = 50
+    @patch("todo.services.task_service.TaskRepository.list_with_count")
+    def test_get_tasks_returns_empty_response_when_page_exceeds_range(self, mock_list_with_count: Mock):
+        mock_list_with_count.return_value = ([], 50)
 
         response: GetTasksResponse = TaskService.get_tasks(
             page=999, limit=10, sort_by="createdAt", order="desc", user_id="test_user"
@@ -198,9 +192,9 @@ class TaskServiceTests(AuthenticatedMongoTestCase):
             self.assertEqual(len(response.tasks), 0)
             self.assertIsNone(response.links)
 
-    @patch("todo.services.task_service.TaskRepository.list")
-    def test_get_tasks_handles_general_exception(self, mock_list: Mock):
-        mock_list.side_effect = Exception("Test general error")
+    @patch("todo.services.task_service.TaskRepository.list_with_count")
+    def test_get_tasks_handles_repository_error(self, mock_list_with_count: Mock):
+        mock_list_with_count.side_effect = PyMongoError("Test repository error")
 
         response = TaskService.get_tasks(page=1, limit=10, sort_by="createdAt", order="desc", user_id="test_user")
 
@@ -208,6 +202,13 @@ class TaskServiceTests(AuthenticatedMongoTestCase):
         self.assertEqual(len(response.tasks), 0)
         self.assertIsNone(response.links)
 
+    @patch("todo.services.task_service.TaskRepository.list_with_count")
+    def test_get_tasks_propagates_unexpected_exception(self, mock_list_with_count: Mock):
+        mock_list_with_count.side_effect = Exception("Test general error")
+
+        with self.assertRaises(Exception):
+            TaskService.get_tasks(page=1, limit=10, sort_by="createdAt", order="desc", user_id="test_user")
+
     @patch("todo.services.task_service.TaskRepository.create")
     @patch("todo.services.task_service.TaskService.prepare_task_dto")
     @patch("todo.services.task_service.TaskAssignmentService.create_task_assignment")
@@ -425,75 +426,67 @@ class TaskServiceTests(AuthenticatedMongoTestCase):
 
 
 class TaskServiceSortingTests(TestCase):
-    @patch("todo.services.task_service.TaskRepository.count")
-    @patch("todo.services.task_service.TaskRepository.list")
-    def test_get_tasks_default_sorting(self, mock_list, mock_count):
-        mock_list.return_value = []
-        mock_count.return_value = 0
+    def setUp(self):
+        # Listing counts are cached between requests; tests must not share them
+        cache.clear()
+
+    @patch("todo.services.task_service.TaskRepository.list_with_count")
+    def test_get_tasks_default_sorting(self, mock_list_with_count):
+        mock_list_with_count.return_value = ([], 0)
 
         TaskService.get_tasks(page=1, limit=20, sort_by="createdAt", order="desc", user_id="test_user")
 
-        mock_list.assert_called_once_with(
+        mock_list_with_count.assert_called_once_with(
             1, 20, SORT_FIELD_CREATED_AT, SORT_ORDER_DESC, "test_user", team_id=None, status_filter=None
         )
 
-    @patch("todo.services.task_service.TaskRepository.count")
-    @patch("todo.services.task_service.TaskRepository.list")
-    def test_get_tasks_explicit_sort_by_priority(self, mock_list, mock_count):
-        mock_list.return_value = []
-        mock_count.return_value = 0
+    @patch("todo.services.task_service.TaskRepository.list_with_count")
+    def test_get_tasks_explicit_sort_by_priority(self, mock_list_with_count):
+        mock_list_with_count.return_value = ([], 0)
 
         TaskService.get_tasks(page=1, limit=20, sort_by=SORT_FIELD_PRIORITY, order=SORT_ORDER_DESC, user_id="test_user")
 
-        mock_list.assert_called_once_with(
+        mock_list_with_count.assert_called_once_with(
             1, 20, SORT_FIELD_PRIORITY, SORT_ORDER_DESC, "test_user", team_id=None, status_filter=None
         )
 
-    @patch("todo.services.task_service.TaskRepository.count")
-    @patch("todo.services.task_service.TaskRepository.list")
-    def test_get_tasks_sort_by_due_at_default_order(self, mock_list, mock_count):
-        mock_list.return_value = []
-        mock_count.return_value = 0
+    @patch("todo.services.task_service.TaskRepository.list_with_count")
+    def test_get_tasks_sort_by_due_at_default_order(self, mock_list_with_count):
+        mock_list_with_count.return_value = ([], 0)
 
         TaskService.get_tasks(page=1, limit=20, sort_by=SORT_FIELD_DUE_AT, order="asc", user_id="test_user")
 
-        mock_list.assert_called_once_with(
+        mock_list_with_count.assert_called_once_with(
             1, 20, SORT_FIELD_DUE_AT, SORT_ORDER_ASC, "test_user", team_id=None, status_filter=None
         )
 
-    @patch("todo.services.task_service.TaskRepository.count")
-    @patch("todo.services.task_service.TaskRepository.list")
-    def test_get_tasks_sort_by_priority_default_order(self, mock_list, mock_count):
-        mock_list.return_value = []
-        mock_count.return_value = 0
+    @patch("todo.services.task_service.TaskRepository.list_with_count")
+    def test_get_tasks_sort_by_priority_default_order(self, mock_list_with_count):
+        mock_list_with_count.return_value = ([], 0)
 
         TaskService.get_tasks(page=1, limit=20, sort_by=SORT_FIELD_PRIORITY, order="desc", user_id="test_user")
 
-        mock_list.assert_called_once_with(
+        mock_list_with_count.assert_called_once_with(
             1, 20, SORT_FIELD_PRIORITY, SORT_ORDER_DESC, "test_user", team_id=None, status_filter=None
         )
 
-    @patch("todo.services.task_service.TaskRepository.count")
-    @patch("todo.services.task_service.TaskRepository.list")
-    def test_get_tasks_sort_by_assignee_default_order(self, mock_list, mock_count):
-        mock_list.return_value = []
-        mock_count.return_value = 0
+    @patch("todo.services.task_service.TaskRepository.list_with_count")
+    def test_get_tasks_sort_by_assignee_default_order(self, mock_list_with_count):
+        mock_list_with_count.return_value = ([], 0)
 
         TaskService.get_tasks(page=1, limit=20, sort_by=SORT_FIELD_ASSIGNEE, order="asc", user_id="test_user")
 
-        mock_list.assert_called_once_with(
+        mock_list_with_count.assert_called_once_with(
             1, 20, SORT_FIELD_ASSIGNEE, SORT_ORDER_ASC, "test_user", team_id=None, status_filter=None
         )
 
-    @patch("todo.services.task_service.TaskRepository.count")
-    @patch("todo.services.task_service.TaskRepository.list")
-    def test_get_tasks_sort_by_created_at_default_order(self, mock_list, mock_count):
-        mock_list.return_value = []
-        mock_count.return_value = 0
+    @patch("todo.services.task_service.TaskRepository.list_with_count")
+    def test_get_tasks_sort_by_created_at_default_order(self, mock_list_with_count):
+        mock_list_with_count.return_value = ([], 0)
 
         TaskService.get_tasks(page=1, limit=20, sort_by=SORT_FIELD_CREATED_AT, order="desc", user_id="test_user")
 
-        mock_list.assert_called_once_with(
+        mock_list_with_count.assert_called_once_with(
             1, 20, SORT_FIELD_CREATED_AT, SORT_ORDER_DESC, "test_user", team_id=None, status_filter=None
         )
 
@@ -511,20 +504,21 @@ class TaskServiceSortingTests(TestCase):
         expected_url = "/v1/tasks?page=1&limit=20&sort_by=dueAt&order=asc"
         self.assertEqual(url, expected_url)
 
-    @patch("todo.services.task_service.TaskRepository.count")
-    @patch("todo.services.task_service.TaskRepository.list")
-    def test_get_tasks_pagination_links_preserve_sort_params(self, mock_list, mock_count):
+    @patch("todo.services.task_service.TaskRepository.list_with_count")
+    def test_get_tasks_pagination_links_preserve_sort_params(self, mock_list_with_count):
         """Test that pagination links preserve sort parameters"""
         from todo.tests.fixtures.task import tasks_models
 
         mock_user = MagicMock()
         mock_user.name = "Test User"
 
-        mock_list.return_value = [tasks_models[0]]
-        mock_count.return_value = 3
+        mock_list_with_count.return_value = ([tasks_models[0]], 3)
 
         with (
             patch("todo.services.task_service.LabelRepository.list_by_ids", return_value=[]),
+            patch("todo.services.task_service.TaskAssignmentRepository.get_by_task_ids", return_value=[]),
+            patch("todo.services.task_service.WatchlistRepository.get_by_user_and_task_ids", return_value={}),
+            patch("todo.services.task_service.UserRepository.list_by_ids", return_value={}),
             patch("todo.services.task_service.UserRepository.get_by_id", return_value=mock_user),
             patch("todo.services.task_service.reverse_lazy", return_value="/v1/tasks"),
         ):
@@ -539,6 +533,79 @@ class TaskServiceSortingTests(TestCase):
             self.assertIn("order=desc", response.links.prev)
 
 
+class TaskServiceCursorPaginationTests(TestCase):
+    @staticmethod
+    def _task_dto(task) -> TaskDTO:
+        return TaskDTO(
+            id=str(task.id),
+            displayId=task.displayId or "#1",
+            title=task.title,
+            createdAt=task.createdAt,
+            createdBy=UserDTO(id=str(task.createdBy), name="Test User"),
+        )
+
+    def test_cursor_round_trip(self):
+        task = tasks_models[0]
+
+        cursor = TaskService._encode_cursor(task)
+        decoded = TaskService._decode_cursor(cursor)
+
+        self.assertEqual(decoded["_id"], str(task.id))
+        self.assertEqual(decoded["lastActivity"], task.updatedAt or task.createdAt)
+
+    def test_decode_cursor_raises_validation_error_for_garbage(self):
+        with self.assertRaises(ValidationError):
+            TaskService._decode_cursor("not-a-valid-cursor")
+
+    @patch("todo.services.task_service.UserRepository.list_by_ids", return_value={})
+    @patch("todo.services.task_service.WatchlistRepository.get_by_user_and_task_ids", return_value={})
+    @patch("todo.services.task_service.TaskAssignmentRepository.get_by_task_ids", return_value=[])
+    @patch("todo.services.task_service.LabelRepository.list_by_ids", return_value=[])
+    @patch("todo.services.task_service.TaskService.prepare_task_dto")
+    @patch("todo.services.task_service.TaskRepository.list")
+    def test_get_tasks_with_cursor_uses_keyset_list(self, mock_list, mock_prepare_dto, *_):
+        task, look_ahead_task = tasks_models[0], tasks_models[1]
+        # The repository returns one look-ahead row past the page when more
+        # results exist; the service trims it and emits the next cursor
+        mock_list.return_value = [task, look_ahead_task]
+        mock_prepare_dto.return_value = self._task_dto(task)
+        cursor = TaskService._encode_cursor(task)
+
+        response = TaskService.get_tasks(
+            page=1, limit=1, sort_by="updatedAt", order="desc", user_id="test_user", cursor=cursor
+        )
+
+        mock_list.assert_called_once()
+        self.assertEqual(mock_list.call_args.kwargs["cursor"], TaskService._decode_cursor(cursor))
+        self.assertIsNone(response.links)
+        self.assertEqual(len(response.tasks), 1)
+        self.assertEqual(response.next_cursor, TaskService._encode_cursor(task))
+
+    @patch("todo.services.task_service.UserRepository.list_by_ids", return_value={})
+    @patch("todo.services.task_service.WatchlistRepository.get_by_user_and_task_ids", return_value={})
+    @patch("todo.services.task_service.TaskAssignmentRepository.get_by_task_ids", return_value=[])
+    @patch("todo.services.task_service.LabelRepository.list_by_ids", return_value=[])
+    @patch("todo.services.task_service.TaskService.prepare_task_dto")
+    @patch("todo.services.task_service.TaskRepository.list")
+    def test_get_tasks_with_cursor_omits_next_cursor_on_short_page(self, mock_list, mock_prepare_dto, *_):
+        mock_list.return_value = [tasks_models[0]]
+        mock_prepare_dto.return_value = self._task_dto(tasks_models[0])
+        cursor = TaskService._encode_cursor(tasks_models[0])
+
+        response = TaskService.get_tasks(
+            page=1, limit=10, sort_by="updatedAt", order="desc", user_id="test_user", cursor=cursor
+        )
+
+        self.assertIsNone(response.next_cursor)
+
+    def test_get_tasks_with_invalid_cursor_returns_validation_error(self):
+        response = TaskService.get_tasks(
+            page=1, limit=10, sort_by="updatedAt", order="desc", user_id="test_user", cursor="@@@"
+        )
+
+        self.assertEqual(response.error["code"], "VALIDATION_ERROR")
+
+
 class TaskServiceUpdateTests(TestCase):
     def setUp(self):
         self.task_id_str = str(ObjectId())
@@ -1193,9 +1260,10 @@ class TaskServiceDeferTests(TestCase):
 
         mock_repo_get_by_id.assert_called_once_with(self.task_id)
 
+    @patch("todo.services.task_service.TaskRepository.exists", return_value=False)
     @patch("todo.services.task_service.TaskRepository.update")
     @patch("todo.services.task_service.TaskRepository.get_by_id")
-    def test_defer_task_raises_task_not_found_on_update_failure(self, mock_repo_get_by_id, mock_repo_update):
+    def test_defer_task_raises_task_not_found_on_update_failure(self, mock_repo_get_by_id, mock_repo_update, _):
         mock_repo_get_by_id.return_value = self.task_model
         mock_repo_update.return_value = None
         valid_deferred_till = self.current_time + timedelta(days=5)
@@ -49,6 +49,13 @@ class TaskListView(APIView):
                 location=OpenApiParameter.QUERY,
                 description="Number of tasks per page",
             ),
+            OpenApiParameter(
+                name="cursor",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="Opaque cursor from a previous response's next_cursor; when provided, keyset pagination is used instead of page.",
+                required=False,
+            ),
             OpenApiParameter(
                 name="teamId",
                 type=OpenApiTypes.STR,
@@ -108,6 +115,7 @@ class TaskListView(APIView):
             user_id=request.user_id,
             team_id=team_id,
             status_filter=status_filter,
+            cursor=query.validated_data.get("cursor"),
         )
 
         if response.error and response.error.get("code") == "FORBIDDEN":
@@ -18,7 +18,8 @@ class DatabaseManager:
 
     def _get_database_client(self):
         if self._database_client is None:
-            self._database_client = MongoClient(settings.MONGODB_URI, tz_aware=True)
+            mongo_options = getattr(settings, "MONGO_OPTIONS", {})
+            self._database_client = MongoClient(settings.MONGODB_URI, tz_aware=True, **mongo_options)
         return self._database_client
 
     def get_database(self):
@@ -206,6 +206,185 @@ def migrate_predefined_roles() -> bool:
         return False
 
 
+def migrate_query_indexes() -> bool:
+    """
+    Migration to create compound indexes matching the filter and sort shapes
+    emitted by the task list endpoints.
+
+    Without these, the status-filtered list queries collection-scan `tasks`
+    and sort in memory, and the assignment lookups cannot be covered by an
+    index. `create_index` is idempotent, so this migration can be run
+    multiple times safely.
+
+    Returns:
+        bool: True if migration completed successfully, False otherwise
+    """
+    logger.info("Starting query indexes migration")
+
+    index_specs: Dict[str, List[List[tuple]]] = {
+        "tasks": [
+            [("status", 1), ("deferredDetails.deferredTill", 1), ("updatedAt", -1)],
+            [("createdBy", 1), ("updatedAt", -1)],
+            [("priority", 1), ("updatedAt", -1)],
+            # Matches the keyset sort (lastActivity, _id) exactly, so cursor
+            # pages walk the index instead of sorting in memory
+            [("lastActivity", -1), ("_id", -1)],
+        ],
+        "task_details": [
+            [("assignee_id", 1), ("user_type", 1), ("is_active", 1), ("task_id", 1)],
+            [("team_id", 1), ("is_active", 1), ("task_id", 1)],
+        ],
+        "user_team_details": [
+            [("user_id", 1), ("is_active", 1), ("team_id", 1)],
+        ],
+    }
+
+    try:
+        db_manager = DatabaseManager()
+        created_count = 0
+
+        for collection_name, indexes in index_specs.items():
+            collection = db_manager.get_collection(collection_name)
+            for keys in indexes:
+                try:
+                    index_name = collection.create_index(keys)
+                    logger.info(f"Ensured index '{index_name}' on '{collection_name}'")
+                    created_count += 1
+                except Exception as e:
+                    logger.error(f"Failed to create index {keys} on '{collection_name}': {str(e)}")
+
+        total_indexes = sum(len(indexes) for indexes in index_specs.values())
+        logger.info(f"Query indexes migration completed - {created_count}/{total_indexes} ensured")
+
+        return created_count == total_indexes
+
+    except Exception as e:
+        logger.error(f"Query indexes migration failed: {str(e)}")
+        return False
+
+
+def migrate_task_last_activity() -> bool:
+    """
+    Migration to backfill the `lastActivity` field on tasks and index it.
+
+    `lastActivity` mirrors `updatedAt` (falling back to `createdAt`) and is
+    maintained on every task write, so sorted list queries no longer need a
+    per-document `$ifNull`/`$toDate` aggregation. Idempotent: only documents
+    missing the field are touched and `create_index` is a no-op when the
+    index already exists.
+
+    Returns:
+        bool: True if migration completed successfully, False otherwise
+    """
+    logger.info("Starting task lastActivity migration")
+
+    try:
+        db_manager = DatabaseManager()
+        tasks_collection = db_manager.get_collection("tasks")
+
+        result = tasks_collection.update_many(
+            {"lastActivity": {"$exists": False}},
+            [{"$set": {"lastActivity": {"$ifNull": [{"$toDate": "$updatedAt"}, {"$toDate": "$createdAt"}]}}}],
+        )
+        index_name = tasks_collection.create_index([("lastActivity", -1)])
+
+        logger.info(
+            f"Task lastActivity migration completed - {result.modified_count} backfilled, index '{index_name}' ensured"
+        )
+        return True
+
+    except Exception as e:
+        logger.error(f"Task lastActivity migration failed: {str(e)}")
+        return False
+
+
+def migrate_normalize_team_poc_id() -> bool:
+    """
+    Migration to normalize `teams.poc_id` to ObjectId and index it.
+
+    Older documents stored `poc_id` as a string, forcing readers to match
+    both representations, which defeats index use on the field. New writes
+    already store ObjectId; this converts the stragglers (leaving any
+    non-ObjectId-shaped value untouched) and ensures a plain index.
+    Idempotent: converted documents no longer match the string-type filter.
+
+    Returns:
+        bool: True if migration completed successfully, False otherwise
+    """
+    logger.info("Starting team poc_id normalization migration")
+
+    try:
+        db_manager = DatabaseManager()
+        teams_collection = db_manager.get_collection("teams")
+
+        result = teams_collection.update_many(
+            {"poc_id": {"$type": "string"}},
+            [{"$set": {"poc_id": {"$convert": {"input": "$poc_id", "to": "objectId", "onError": "$poc_id"}}}}],
+        )
+        index_name = teams_collection.create_index("poc_id")
+
+        logger.info(
+            f"Team poc_id normalization completed - {result.modified_count} converted, index '{index_name}' ensured"
+        )
+        return True
+
+    except Exception as e:
+        logger.error(f"Team poc_id normalization migration failed: {str(e)}")
+        return False
+
+
+def migrate_unique_active_assignment_index() -> bool:
+    """
+    Migration to enforce a single active assignment per task.
+
+    Deactivates all but the most recent active assignment for any task that
+    accumulated several, then creates a unique partial index on `task_id` for
+    active documents so the create-or-replace upsert cannot race itself into
+    duplicates. Idempotent: the dedup pass matches nothing on a clean
+    collection and `create_index` is a no-op once the index exists.
+
+    Returns:
+        bool: True if migration completed successfully, False otherwise
+    """
+    logger.info("Starting unique active assignment index migration")
+
+    try:
+        db_manager = DatabaseManager()
+        assignments_collection = db_manager.get_collection("task_details")
+
+        duplicates = assignments_collection.aggregate(
+            [
+                {"$match": {"is_active": True}},
+                {"$sort": {"created_at": -1}},
+                {"$group": {"_id": "$task_id", "ids": {"$push": "$_id"}, "count": {"$sum": 1}}},
+                {"$match": {"count": {"$gt": 1}}},
+            ]
+        )
+        stale_ids = [doc_id for group in duplicates for doc_id in group["ids"][1:]]
+
+        deactivated_count = 0
+        if stale_ids:
+            result = assignments_collection.update_many(
+                {"_id": {"$in": stale_ids}},
+                {"$set": {"is_active": False, "updated_at": datetime.now(timezone.utc)}},
+            )
+            deactivated_count = result.modified_count
+
+        index_name = assignments_collection.create_index(
+            [("task_id", 1)], unique=True, partialFilterExpression={"is_active": True}
+        )
+
+        logger.info(
+            f"Unique active assignment index migration completed - "
+            f"{deactivated_count} duplicates deactivated, index '{index_name}' ensured"
+        )
+        return True
+
+    except Exception as e:
+        logger.error(f"Unique active assignment index migration failed: {str(e)}")
+        return False
+
+
 def run_all_migrations() -> bool:
     """
     Run all database migrations.
@@ -218,6 +397,10 @@ def run_all_migrations() -> bool:
     migrations = [
         ("Fixed Labels Migration", migrate_fixed_labels),
         ("Predefined Roles Migration", migrate_predefined_roles),
+        ("Query Indexes Migration", migrate_query_indexes),
+        ("Task LastActivity Migration", migrate_task_last_activity),
+        ("Team POC Id Normalization Migration", migrate_normalize_team_poc_id),
+        ("Unique Active Assignment Index Migration", migrate_unique_active_assignment_index),
     ]
 
     success_count = 0